@@ -0,0 +1,39 @@
+"""add timeline sync state
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+
+Stores an updated_at watermark per (project, source table) so timeline
+sync only re-reads source rows that changed since the last run.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'timeline_sync_states',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('source_table', sa.String(50), nullable=False),
+        sa.Column('watermark', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), onupdate=sa.text('now()')),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('project_id', 'source_table', name='uq_timeline_sync_state_project_source')
+    )
+    op.create_index('ix_timeline_sync_states_project_id', 'timeline_sync_states', ['project_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_timeline_sync_states_project_id', table_name='timeline_sync_states')
+    op.drop_table('timeline_sync_states')
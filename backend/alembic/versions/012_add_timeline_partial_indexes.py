@@ -0,0 +1,39 @@
+"""add timeline partial indexes
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+
+Partial indexes for the default get_timeline_events filters:
+- visible events ordered by chapter / position
+- major story beats by chapter
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_tle_visible_chapter',
+        'timeline_events',
+        ['project_id', 'chapter_number', 'position_weight'],
+        postgresql_where=sa.text('is_visible = true')
+    )
+    op.create_index(
+        'idx_tle_major_beat',
+        'timeline_events',
+        ['project_id', 'chapter_number'],
+        postgresql_where=sa.text('is_major_beat = true')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tle_major_beat', table_name='timeline_events')
+    op.drop_index('idx_tle_visible_chapter', table_name='timeline_events')
@@ -0,0 +1,41 @@
+"""timeline tags as jsonb with GIN index
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+
+get_timeline_events filters tags with a single jsonb ?& / ?| predicate,
+which needs the column to be jsonb and a GIN index to be indexable.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'timeline_events',
+        'tags',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='tags::jsonb',
+        server_default=sa.text("'[]'::jsonb")
+    )
+    op.create_index('idx_tle_tags', 'timeline_events', ['tags'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tle_tags', table_name='timeline_events')
+    op.alter_column(
+        'timeline_events',
+        'tags',
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        postgresql_using='tags::json',
+        server_default=sa.text("'[]'::json")
+    )
@@ -0,0 +1,31 @@
+"""add timeline sync lookup index
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-17
+
+Every timeline sync phase looks events up by
+(project_id, event_type, source_id).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Not unique: all beats of a book arc share the arc's id as source_id
+    op.create_index(
+        'ix_tle_project_type_source',
+        'timeline_events',
+        ['project_id', 'event_type', 'source_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tle_project_type_source', table_name='timeline_events')
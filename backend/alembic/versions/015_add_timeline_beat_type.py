@@ -0,0 +1,43 @@
+"""add timeline beat_type column
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-17
+
+Beat events all share the book arc id as source_id, so the beat name is
+denormalized into its own column instead of being read from event_metadata.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'timeline_events',
+        sa.Column('beat_type', sa.String(50), nullable=True)
+    )
+
+    # Backfill existing beats from their metadata (only beats carry a 'beat' key)
+    op.execute("""
+        UPDATE timeline_events
+        SET beat_type = event_metadata->'beat'->>'beat_type'
+        WHERE event_metadata->'beat' IS NOT NULL
+    """)
+
+    op.create_index(
+        'ix_tle_project_type_beat',
+        'timeline_events',
+        ['project_id', 'event_type', 'beat_type']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tle_project_type_beat', table_name='timeline_events')
+    op.drop_column('timeline_events', 'beat_type')
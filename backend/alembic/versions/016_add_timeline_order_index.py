@@ -0,0 +1,40 @@
+"""add timeline chapter order index
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-17
+
+Covers get_timeline_events ordering when hidden events are included
+(idx_tle_visible_chapter only holds visible ones). The sync lookup index
+on (project_id, event_type, source_id) already exists (014), and beats
+no longer need a metadata index since they are looked up by beat_type.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_tle_project_chapter_order',
+            'timeline_events',
+            ['project_id', 'chapter_number', 'position_weight'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_tle_project_chapter_order',
+            table_name='timeline_events',
+            postgresql_concurrently=True
+        )
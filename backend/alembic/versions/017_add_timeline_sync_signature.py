@@ -0,0 +1,29 @@
+"""add timeline sync state signature
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-17
+
+Lets beat sync skip a book arc whose beat fields didn't change even
+though the row's updated_at moved.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'timeline_sync_states',
+        sa.Column('signature', sa.String(64), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('timeline_sync_states', 'signature')
@@ -0,0 +1,52 @@
+"""add timeline conflict arc_id
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-17
+
+Arc-level continuity conflicts were matched by a LIKE on the
+description ("Arc ID: <id>"); store the arc id in its own column.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'timeline_conflicts',
+        sa.Column('arc_id', sa.Integer(), nullable=True)
+    )
+    op.create_foreign_key(
+        'fk_timeline_conflicts_arc_id',
+        'timeline_conflicts', 'character_arcs',
+        ['arc_id'], ['id'],
+        ondelete='CASCADE'
+    )
+
+    # Backfill from the description of existing arc conflicts
+    op.execute("""
+        UPDATE timeline_conflicts
+        SET arc_id = substring(description from 'Arc ID: ([0-9]+)')::integer
+        WHERE detection_method = 'continuity_detector'
+          AND description LIKE '%Arc ID: %'
+          AND substring(description from 'Arc ID: ([0-9]+)')::integer IN (SELECT id FROM character_arcs)
+    """)
+
+    op.create_index(
+        'idx_tlc_project_type_method',
+        'timeline_conflicts',
+        ['project_id', 'conflict_type', 'detection_method']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tlc_project_type_method', table_name='timeline_conflicts')
+    op.drop_constraint('fk_timeline_conflicts_arc_id', 'timeline_conflicts', type_='foreignkey')
+    op.drop_column('timeline_conflicts', 'arc_id')
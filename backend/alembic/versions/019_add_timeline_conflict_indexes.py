@@ -0,0 +1,37 @@
+"""add timeline conflict lookup indexes
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-17
+
+Composite indexes for the conflict detectors' existence checks and the
+get_conflicts filters. Major-beat lookups of the pacing detector are
+already served by the partial idx_tle_major_beat (012).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tc_project_type_chapter',
+        'timeline_conflicts',
+        ['project_id', 'conflict_type', 'chapter_start', 'chapter_end']
+    )
+    op.create_index(
+        'ix_tc_project_status_sev',
+        'timeline_conflicts',
+        ['project_id', 'status', 'severity']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tc_project_status_sev', table_name='timeline_conflicts')
+    op.drop_index('ix_tc_project_type_chapter', table_name='timeline_conflicts')
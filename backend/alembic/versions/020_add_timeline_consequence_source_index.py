@@ -0,0 +1,35 @@
+"""add timeline consequence source expression index
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-17
+
+Continuity detection reads a consequence's source story event id
+straight from event_metadata in SQL; index that expression.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Same expression SQLAlchemy emits for
+    # event_metadata[("consequence", "source_event_id")].as_integer()
+    op.execute("""
+        CREATE INDEX ix_tle_consequence_source
+        ON timeline_events (
+            project_id,
+            (CAST(event_metadata #>> '{consequence,source_event_id}' AS INTEGER))
+        )
+        WHERE event_metadata #>> '{consequence,source_event_id}' IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tle_consequence_source', table_name='timeline_events')
@@ -0,0 +1,40 @@
+"""add timeline conflict severity rank index
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-17
+
+get_conflicts orders by an explicit severity rank (critical first) and
+then chapter_start; index that expression so the listing avoids a sort.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Same CASE SQLAlchemy emits for the severity_rank in get_conflicts
+    # (the enum column stores member names)
+    op.execute("""
+        CREATE INDEX ix_tc_project_severity_rank
+        ON timeline_conflicts (
+            project_id,
+            (CASE severity
+                WHEN 'CRITICAL' THEN 0
+                WHEN 'ERROR' THEN 1
+                WHEN 'WARNING' THEN 2
+                WHEN 'INFO' THEN 3
+            END),
+            chapter_start
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tc_project_severity_rank', table_name='timeline_conflicts')
@@ -0,0 +1,41 @@
+"""add agent memory filter indexes
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-17
+
+Memory retrieval filters on agent, type and minimum importance, so the
+(agent_id, memory_type) index gains a trailing importance column and is
+replaced. Expired-memory cleanup gets a partial index over the rows that
+can expire at all.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_agent_memories_agent_type_importance',
+        'agent_memories',
+        ['agent_id', 'memory_type', sa.text('importance DESC')]
+    )
+    op.drop_index('ix_agent_memories_agent_type', table_name='agent_memories')
+    op.create_index(
+        'ix_agent_memories_expires_at',
+        'agent_memories',
+        ['expires_at'],
+        postgresql_where=sa.text('expires_at IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_agent_memories_expires_at', table_name='agent_memories')
+    op.create_index('ix_agent_memories_agent_type', 'agent_memories', ['agent_id', 'memory_type'])
+    op.drop_index('ix_agent_memories_agent_type_importance', table_name='agent_memories')
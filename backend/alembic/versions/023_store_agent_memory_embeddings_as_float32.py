@@ -0,0 +1,66 @@
+"""store agent memory embeddings as float32 bytes
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-17
+
+agent_memories.embedding moves from JSON float lists to raw little-endian
+float32 bytes (see Float32Vector). Existing vectors are converted in
+batches through a temporary column.
+"""
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '023'
+down_revision = '022'
+branch_labels = None
+depends_on = None
+
+_BATCH_SIZE = 1000
+
+
+def _convert(source: sa.ColumnClause, target: sa.ColumnClause, encode) -> None:
+    """Copy every non-null embedding from source to target column, encoded"""
+    bind = op.get_bind()
+    table = sa.table('agent_memories', sa.column('id', sa.Integer), source, target)
+    source, target = source.name, target.name
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(table.c.id, table.c[source])
+            .where(table.c.id > last_id, table.c[source].isnot(None))
+            .order_by(table.c.id)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            table.update().where(table.c.id == sa.bindparam('row_id')),
+            [{'row_id': row_id, target: encode(value)} for row_id, value in rows]
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column('agent_memories', sa.Column('embedding_f32', sa.LargeBinary(), nullable=True))
+    _convert(
+        sa.column('embedding', sa.JSON),
+        sa.column('embedding_f32', sa.LargeBinary),
+        lambda value: np.asarray(value, dtype='<f4').tobytes()
+    )
+    op.drop_column('agent_memories', 'embedding')
+    op.alter_column('agent_memories', 'embedding_f32', new_column_name='embedding')
+
+
+def downgrade() -> None:
+    op.alter_column('agent_memories', 'embedding', new_column_name='embedding_f32')
+    op.add_column('agent_memories', sa.Column('embedding', sa.JSON(), nullable=True))
+    _convert(
+        sa.column('embedding_f32', sa.LargeBinary),
+        sa.column('embedding', sa.JSON),
+        lambda value: np.frombuffer(value, dtype='<f4').tolist()
+    )
+    op.drop_column('agent_memories', 'embedding_f32')
@@ -0,0 +1,78 @@
+"""re-embed agent memories with the SHAKE-256 placeholder embedding
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-17
+
+The placeholder embedder moved from a zero-padded sha256 digest to one
+128-byte shake_256 digest, which changes the vector of every text.
+Stored embeddings are recomputed from agent_memories.content so search
+and consolidation compare old and new rows on the same scheme. Both
+schemes are inlined here so the migration does not depend on app code.
+"""
+from alembic import op
+import hashlib
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '024'
+down_revision = '023'
+branch_labels = None
+depends_on = None
+
+_BATCH_SIZE = 1000
+_DIMENSIONS = 128
+
+
+def _to_float32_bytes(hash_bytes: bytes) -> bytes:
+    """Map hash bytes to [-1, 1], zero-pad to 128-D, unit-normalize, pack"""
+    vector = np.zeros(_DIMENSIONS)
+    vector[:len(hash_bytes)] = (np.frombuffer(hash_bytes, dtype=np.uint8) - 128.0) / 128.0
+    norm = np.linalg.norm(vector)
+    if norm:
+        vector /= norm
+    return vector.astype('<f4').tobytes()
+
+
+def _shake256_embedding(text: str) -> bytes:
+    return _to_float32_bytes(hashlib.shake_256(text.encode()).digest(_DIMENSIONS))
+
+
+def _sha256_embedding(text: str) -> bytes:
+    return _to_float32_bytes(hashlib.sha256(text.encode()).digest())
+
+
+def _reembed(embed) -> None:
+    """Recompute every non-null embedding from its memory's content"""
+    bind = op.get_bind()
+    table = sa.table(
+        'agent_memories',
+        sa.column('id', sa.Integer),
+        sa.column('content', sa.Text),
+        sa.column('embedding', sa.LargeBinary)
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(table.c.id, table.c.content)
+            .where(table.c.id > last_id, table.c.embedding.isnot(None))
+            .order_by(table.c.id)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            table.update().where(table.c.id == sa.bindparam('row_id')),
+            [{'row_id': row_id, 'embedding': embed(content or '')} for row_id, content in rows]
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    _reembed(_shake256_embedding)
+
+
+def downgrade() -> None:
+    _reembed(_sha256_embedding)
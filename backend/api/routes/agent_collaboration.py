@@ -4,9 +4,11 @@ Agent Collaboration API Routes
 REST endpoints for multi-agent collaboration system
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from core.database.base import get_db
 from core.models import (
@@ -22,6 +24,31 @@ from api.schemas.agent_collaboration import *
 router = APIRouter()
 
 
+# ==================== SERIALIZATION ====================
+
+# Heavy read and create endpoints validate once and dump straight to JSON bytes;
+# response_model stays on the route for the OpenAPI schema only
+_AGENT_LIST = TypeAdapter(List[AgentResponse])
+_TASK_QUEUE = TypeAdapter(TaskQueueResponse)
+_CONVERSATION_LIST = TypeAdapter(List[ConversationResponse])
+_MEMORY_LIST = TypeAdapter(List[MemoryResponse])
+_PROJECT_STATISTICS = TypeAdapter(ProjectAgentStatisticsResponse)
+_AGENT_DETAIL = TypeAdapter(AgentDetailResponse)
+_TASK_DETAIL = TypeAdapter(TaskDetailResponse)
+_BATCH_TASKS = TypeAdapter(BatchTasksResponse)
+_MESSAGE = TypeAdapter(MessageResponse)
+_MEMORY = TypeAdapter(MemoryResponse)
+
+
+def _json_response(adapter: TypeAdapter, value: Any, status_code: int = 200) -> Response:
+    """Serialize value through adapter without FastAPI's response_model pass"""
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(value, from_attributes=True)),
+        media_type="application/json",
+        status_code=status_code
+    )
+
+
 # ==================== DEPENDENCY INJECTION ====================
 
 def get_orchestration_service(db: Session = Depends(get_db)) -> AgentOrchestrationService:
@@ -34,6 +61,36 @@ def get_memory_service(db: Session = Depends(get_db)) -> AgentMemoryService:
 
 # ==================== AGENT MANAGEMENT ====================
 
+# Standard team created by initialize_default_agents
+_DEFAULT_AGENTS = (
+    {
+        "name": "Plot Master",
+        "agent_type": AgentType.PLOTTING,
+        "description": "Analyzes and develops plot structure"
+    },
+    {
+        "name": "Character Developer",
+        "agent_type": AgentType.CHARACTER,
+        "description": "Develops character arcs and motivations"
+    },
+    {
+        "name": "Dialogue Specialist",
+        "agent_type": AgentType.DIALOGUE,
+        "description": "Reviews and writes dialogue"
+    },
+    {
+        "name": "Continuity Checker",
+        "agent_type": AgentType.CONTINUITY,
+        "description": "Ensures story consistency"
+    },
+    {
+        "name": "Quality Controller",
+        "agent_type": AgentType.QC,
+        "description": "Reviews overall quality"
+    }
+)
+
+
 @router.post("/projects/{project_id}/agents", response_model=AgentDetailResponse, status_code=201)
 async def create_agent(
     project_id: int,
@@ -63,7 +120,7 @@ async def create_agent(
     db.commit()
     db.refresh(agent)
 
-    return agent
+    return _json_response(_AGENT_DETAIL, agent, status_code=201)
 
 
 @router.get("/projects/{project_id}/agents", response_model=List[AgentResponse])
@@ -87,7 +144,7 @@ async def list_agents(
         query = query.filter(Agent.is_active == is_active)
 
     agents = query.all()
-    return agents
+    return _json_response(_AGENT_LIST, agents)
 
 
 @router.get("/projects/{project_id}/agents/{agent_id}", response_model=AgentDetailResponse)
@@ -195,51 +252,18 @@ async def initialize_default_agents(
     - Continuity Agent
     - QC Agent
     """
-    default_agents = [
-        {
-            "name": "Plot Master",
-            "agent_type": AgentType.PLOTTING,
-            "description": "Analyzes and develops plot structure"
-        },
-        {
-            "name": "Character Developer",
-            "agent_type": AgentType.CHARACTER,
-            "description": "Develops character arcs and motivations"
-        },
-        {
-            "name": "Dialogue Specialist",
-            "agent_type": AgentType.DIALOGUE,
-            "description": "Reviews and writes dialogue"
-        },
-        {
-            "name": "Continuity Checker",
-            "agent_type": AgentType.CONTINUITY,
-            "description": "Ensures story consistency"
-        },
-        {
-            "name": "Quality Controller",
-            "agent_type": AgentType.QC,
-            "description": "Reviews overall quality"
-        }
-    ]
-
-    created_agents = []
-    for agent_data in default_agents:
-        agent = Agent(
-            project_id=project_id,
-            name=agent_data["name"],
-            agent_type=agent_data["agent_type"],
-            description=agent_data["description"]
-        )
-        db.add(agent)
-        created_agents.append(agent)
-
+    # One multi-row INSERT ... RETURNING instead of five INSERTs + refreshes,
+    # returned in _DEFAULT_AGENTS order
+    created_agents = db.execute(
+        insert(Agent).returning(Agent, sort_by_parameter_order=True),
+        [{**agent_data, "project_id": project_id} for agent_data in _DEFAULT_AGENTS]
+    ).scalars().all()
+
+    # Serialize before commit expires the rows (saves a reload per agent)
+    response = _json_response(_AGENT_LIST, created_agents)
     db.commit()
 
-    for agent in created_agents:
-        db.refresh(agent)
-
-    return created_agents
+    return response
 
 
 # ==================== TASK MANAGEMENT ====================
@@ -263,7 +287,7 @@ async def create_task(
         auto_assign=request.auto_assign
     )
 
-    return task
+    return _json_response(_TASK_DETAIL, task, status_code=201)
 
 
 @router.post("/projects/{project_id}/tasks/batch", response_model=BatchTasksResponse)
@@ -294,11 +318,11 @@ async def create_batch_tasks(
 
     total_assigned = sum(1 for task in created_tasks if task.agent_id is not None)
 
-    return {
+    return _json_response(_BATCH_TASKS, {
         "tasks": created_tasks,
         "total_created": len(created_tasks),
         "total_assigned": total_assigned
-    }
+    })
 
 
 @router.get("/projects/{project_id}/tasks", response_model=TaskQueueResponse)
@@ -336,13 +360,13 @@ async def get_task_queue(
         AgentTask.status == TaskStatus.COMPLETED
     ).count()
 
-    return {
+    return _json_response(_TASK_QUEUE, {
         "tasks": tasks,
         "total": len(tasks),
         "pending_count": pending_count,
         "in_progress_count": in_progress_count,
         "completed_count": completed_count
-    }
+    })
 
 
 @router.get("/projects/{project_id}/tasks/{task_id}", response_model=TaskDetailResponse)
@@ -550,7 +574,7 @@ async def list_conversations(
         query = query.filter(AgentConversation.is_resolved == is_resolved)
 
     conversations = query.all()
-    return conversations
+    return _json_response(_CONVERSATION_LIST, conversations)
 
 
 @router.get("/projects/{project_id}/conversations/{conversation_id}", response_model=ConversationDetailResponse)
@@ -601,7 +625,7 @@ async def add_message(
     db.commit()
     db.refresh(message)
 
-    return message
+    return _json_response(_MESSAGE, message)
 
 
 @router.post("/projects/{project_id}/conversations/{conversation_id}/vote", response_model=ConversationDetailResponse)
@@ -710,7 +734,7 @@ async def create_memory(
         context=request.context
     )
 
-    return memory
+    return _json_response(_MEMORY, memory)
 
 
 @router.get("/projects/{project_id}/agents/{agent_id}/memories", response_model=List[MemoryResponse])
@@ -730,7 +754,7 @@ async def get_memories(
         limit=limit
     )
 
-    return memories
+    return _json_response(_MEMORY_LIST, memories)
 
 
 @router.post("/projects/{project_id}/agents/{agent_id}/memories/search", response_model=MemorySearchResponse)
@@ -833,7 +857,7 @@ async def get_project_statistics(
         Agent.user_satisfaction_score.isnot(None)
     ).scalar()
 
-    return {
+    return _json_response(_PROJECT_STATISTICS, {
         "total_agents": total_agents,
         "active_agents": active_agents,
         "busy_agents": busy_agents,
@@ -842,4 +866,4 @@ async def get_project_statistics(
         "completed_tasks": completed_tasks,
         "failed_tasks": failed_tasks,
         "average_satisfaction": float(avg_satisfaction) if avg_satisfaction else None
-    }
+    })
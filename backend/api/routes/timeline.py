@@ -75,7 +75,10 @@ async def sync_project_timeline(
     start_time = time.time()
 
     try:
-        synced_counts = service.sync_project_timeline(project_id)
+        synced_counts = service.sync_project_timeline(
+            project_id,
+            force_full_sync=request.force_full_sync
+        )
         total_synced = sum(synced_counts.values())
 
         # Get conflicts after sync
@@ -106,6 +109,7 @@ async def get_timeline_events(
     tags: Optional[str] = Query(None, description="Comma-separated tags"),
     only_visible: bool = Query(True, description="Only visible events"),
     only_major_beats: bool = Query(False, description="Only major story beats"),
+    match_all_tags: bool = Query(True, description="Require all tags (false = any tag)"),
     service: TimelineService = Depends(get_timeline_service)
 ):
     """
@@ -127,7 +131,8 @@ async def get_timeline_events(
         layers=layers_list,
         tags=tags_list,
         only_visible=only_visible,
-        only_major_beats=only_major_beats
+        only_major_beats=only_major_beats,
+        match_all_tags=match_all_tags
     )
 
     if not events:
@@ -8,6 +8,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool, QueuePool
 import os
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -20,6 +21,17 @@ DATABASE_URL = os.getenv(
 # Async database URL (replace postgresql:// with postgresql+asyncpg://)
 ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
+
+def json_serializer(value) -> str:
+    """
+    Encode JSON columns with orjson (stdlib-compatible str keys)
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON columns are decoded with orjson as well
+json_deserializer = orjson.loads
+
 # === SYNC ENGINE (Legacy - for existing code) ===
 engine = create_engine(
     DATABASE_URL,
@@ -27,6 +39,8 @@ engine = create_engine(
     pool_size=5,
     max_overflow=10,
     pool_pre_ping=True,  # Verify connections before using
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
     echo=os.getenv("SQL_ECHO", "False").lower() == "true"
 )
 
@@ -37,6 +51,8 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
     poolclass=NullPool,  # Async engines require NullPool or AsyncAdaptedQueuePool
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
     echo=os.getenv("SQL_ECHO", "False").lower() == "true"
 )
 
@@ -32,6 +32,7 @@ from .timeline import (
     TimelineConflict,
     TimelineView,
     TimelineBookmark,
+    TimelineSyncState,
     TimelineEventType,
     TimelineLayer,
     ConflictType,
@@ -102,6 +103,7 @@ __all__ = [
     "TimelineConflict",
     "TimelineView",
     "TimelineBookmark",
+    "TimelineSyncState",
     "TimelineEventType",
     "TimelineLayer",
     "ConflictType",
@@ -12,17 +12,43 @@ Multi-agent AI collaboration for writing projects:
 
 from sqlalchemy import (
     Column, Integer, String, Text, Boolean, Float, DateTime,
-    ForeignKey, JSON, Enum as SQLEnum, Index
+    ForeignKey, JSON, LargeBinary, Enum as SQLEnum, Index
 )
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
 import enum
 from typing import Optional, Dict, Any, List
 
+import numpy as np
+
 from ..database.base import Base
 from .base import TimestampMixin
 
 
+# ==================== TYPES ====================
+
+class Float32Vector(TypeDecorator):
+    """
+    Float vector stored as raw little-endian float32 bytes
+
+    Reads and writes plain lists of floats, like the JSON column it
+    replaces, at 4 bytes per dimension and without JSON text parsing.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return np.asarray(value, dtype="<f4").tobytes()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return np.frombuffer(value, dtype="<f4").tolist()
+
+
 # ==================== ENUMS ====================
 
 class AgentType(str, enum.Enum):
@@ -369,7 +395,7 @@ class AgentMemory(Base, TimestampMixin):
     content = Column(Text, nullable=False)
 
     # Semantic search
-    embedding = Column(JSON, nullable=True)  # Vector embedding for similarity search
+    embedding = Column(Float32Vector, nullable=True)  # Vector embedding for similarity search
     embedding_model = Column(String(100), default="text-embedding-3-small")
 
     # Memory metadata
@@ -449,4 +475,5 @@ class AgentVote(Base, TimestampMixin):
 Index('ix_agent_tasks_project_status', AgentTask.project_id, AgentTask.status)
 Index('ix_agent_tasks_agent_status', AgentTask.agent_id, AgentTask.status)
 Index('ix_agent_conversations_project_active', AgentConversation.project_id, AgentConversation.is_active)
-Index('ix_agent_memories_agent_type', AgentMemory.agent_id, AgentMemory.memory_type)
+Index('ix_agent_memories_agent_type_importance', AgentMemory.agent_id, AgentMemory.memory_type, AgentMemory.importance.desc())
+Index('ix_agent_memories_expires_at', AgentMemory.expires_at, postgresql_where=AgentMemory.expires_at.isnot(None))
@@ -3,7 +3,8 @@ Timeline Visualizer Models
 
 Unified timeline view across all project elements
 """
-from sqlalchemy import Column, Integer, String, Text, JSON, ForeignKey, Float, Boolean, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Text, JSON, ForeignKey, Float, Boolean, Enum, DateTime, UniqueConstraint, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 import enum
 from datetime import datetime
@@ -62,6 +63,7 @@ class TimelineEvent(Base, TimestampMixin):
     event_type = Column(Enum(TimelineEventType), nullable=False, index=True)
     source_id = Column(Integer, nullable=True, comment="ID in source table (chapter_id, event_id, etc.)")
     source_table = Column(String(50), nullable=True, comment="Source table name")
+    beat_type = Column(String(50), nullable=True, comment="Beat name for BEAT events (all beats share the book arc source_id)")
 
     # Timeline position
     chapter_number = Column(Integer, nullable=False, index=True, comment="Primary timeline position")
@@ -81,7 +83,7 @@ class TimelineEvent(Base, TimestampMixin):
 
     # Categorization
     layer = Column(Enum(TimelineLayer), nullable=False, default=TimelineLayer.PLOT, index=True)
-    tags = Column(JSON, default=list, comment="User-defined tags for filtering")
+    tags = Column(JSON().with_variant(JSONB(), "postgresql"), default=list, comment="User-defined tags for filtering")
 
     # Visual properties
     color = Column(String(7), nullable=True, comment="Hex color for visualization")
@@ -135,6 +137,27 @@ class TimelineEvent(Base, TimestampMixin):
     last_synced_at = Column(DateTime, nullable=True, comment="When last synced from source")
     sync_hash = Column(String(64), nullable=True, comment="Hash of source data for change detection")
 
+    __table_args__ = (
+        # Partial indexes for the default dashboard filters (visible / major beats)
+        Index(
+            "idx_tle_visible_chapter",
+            "project_id", "chapter_number", "position_weight",
+            postgresql_where=text("is_visible = true")
+        ),
+        Index(
+            "idx_tle_major_beat",
+            "project_id", "chapter_number",
+            postgresql_where=text("is_major_beat = true")
+        ),
+        # Tag filters use jsonb ?& / ?| (default jsonb_ops supports both)
+        Index("idx_tle_tags", "tags", postgresql_using="gin"),
+        # Sync change-detection lookups
+        Index("ix_tle_project_type_source", "project_id", "event_type", "source_id"),
+        Index("ix_tle_project_type_beat", "project_id", "event_type", "beat_type"),
+        # Chapter ordering when hidden events are included
+        Index("idx_tle_project_chapter_order", "project_id", "chapter_number", "position_weight"),
+    )
+
 
 class TimelineConflict(Base, TimestampMixin):
     """
@@ -160,6 +183,7 @@ class TimelineConflict(Base, TimestampMixin):
 
     # Involved events
     event_ids = Column(JSON, nullable=False, default=list, comment="Timeline event IDs involved")
+    arc_id = Column(Integer, ForeignKey("character_arcs.id", ondelete="CASCADE"), nullable=True, comment="Character arc for arc-level conflicts")
 
     # Description
     title = Column(String(255), nullable=False)
@@ -186,6 +210,14 @@ class TimelineConflict(Base, TimestampMixin):
     detection_method = Column(String(50), nullable=True, comment="Which algorithm detected this")
     confidence = Column(Float, nullable=True, comment="0-1 confidence in detection")
 
+    __table_args__ = (
+        # Existing-conflict lookups of the continuity detector
+        Index("idx_tlc_project_type_method", "project_id", "conflict_type", "detection_method"),
+        # Detector existence checks (pacing gaps, overlaps) and get_conflicts filters
+        Index("ix_tc_project_type_chapter", "project_id", "conflict_type", "chapter_start", "chapter_end"),
+        Index("ix_tc_project_status_sev", "project_id", "status", "severity"),
+    )
+
 
 class TimelineView(Base, TimestampMixin):
     """
@@ -255,3 +287,28 @@ class TimelineBookmark(Base, TimestampMixin):
 
     # Order
     sort_order = Column(Integer, default=0, comment="User-defined ordering")
+
+
+class TimelineSyncState(Base, TimestampMixin):
+    """
+    Incremental sync watermark per project and source table
+
+    Sync only re-reads source rows whose updated_at is newer than
+    the stored watermark. The "detection" row records the last full
+    conflict detection run and a fingerprint of what it read.
+    """
+    __tablename__ = "timeline_sync_states"
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    source_table = Column(String(50), nullable=False, comment="Source table name")
+
+    # Highest source updated_at seen by the last sync
+    watermark = Column(DateTime, nullable=True)
+
+    # Hash of the synced source fields, for sources that map one row to many events (book arc beats)
+    signature = Column(String(64), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("project_id", "source_table", name="uq_timeline_sync_state_project_source"),
+    )
@@ -3,6 +3,7 @@ FastAPI Application Entry Point
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from core.database.base import init_db
 import os
 
@@ -11,6 +12,7 @@ app = FastAPI(
     title="Narrative OS API",
     description="AI-powered narrative platform for serious fiction writers",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration
@@ -12,9 +12,11 @@ Manages agent learning and knowledge:
 import json
 import hashlib
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import LargeBinary, and_, or_, func, desc, type_coerce, update
+import numpy as np
 
 from core.models import (
     Agent, AgentMemory, AgentTask, AgentConversation,
@@ -22,6 +24,40 @@ from core.models import (
 )
 
 
+# Dimensions of the placeholder embedding
+_EMBEDDING_DIMENSIONS = 128
+
+# Rows per matrix product when comparing all memories pairwise
+_PAIR_BLOCK_SIZE = 1024
+
+
+@lru_cache(maxsize=4096)
+def _embed_text(text: str) -> Tuple[float, ...]:
+    """
+    Deterministic placeholder embedding of text (cached, immutable)
+
+    Repeated queries, such as recurring agent context prompts, are
+    served from the cache instead of being re-hashed and re-normalized.
+    """
+    # TODO: Integrate with actual embedding service (OpenAI, Cohere, etc.)
+    # This is a placeholder that generates deterministic fake embeddings
+    # Stored rows are compared against new ones, so changing this scheme
+    # needs a migration that re-embeds them (see alembic revision 024)
+
+    # Use hash for deterministic "embedding": one extendable-output digest
+    # supplies a byte for every one of the 128 dimensions
+    hash_bytes = hashlib.shake_256(text.encode()).digest(_EMBEDDING_DIMENSIONS)
+
+    # Convert to floats (normalized to [-1, 1])
+    vector = (np.frombuffer(hash_bytes, dtype=np.uint8).astype(np.float64) - 128.0) / 128.0
+
+    # Store unit vectors so cosine similarity is a plain dot product
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        return tuple(vector.tolist())
+    return tuple((vector / norm).tolist())
+
+
 class AgentMemoryService:
     """
     Manages agent memory and learning
@@ -233,12 +269,7 @@ class AgentMemoryService:
             desc(AgentMemory.created_at)
         ).limit(limit).all()
 
-        # Update access counts
-        for memory in memories:
-            memory.access_count += 1
-            memory.last_accessed_at = datetime.utcnow()
-
-        self.db.commit()
+        self._record_access(memories)
 
         return memories
 
@@ -281,26 +312,65 @@ class AgentMemoryService:
             )
         )
 
-        memories = query_obj.all()
+        # Score the raw float32 bytes; only the top results are loaded as objects
+        candidates = [
+            (memory_id, blob)
+            for memory_id, blob in query_obj.with_entities(
+                AgentMemory.id,
+                type_coerce(AgentMemory.embedding, LargeBinary)
+            ).all()
+            if blob
+        ]
 
-        # Calculate cosine similarity
-        results = []
-        for memory in memories:
-            if memory.embedding:
-                similarity = self._cosine_similarity(query_embedding, memory.embedding)
-                results.append((memory, similarity))
+        # Cosine similarity against all candidates in one matrix-vector product
+        similarities = self._similarity_scores(
+            query_embedding,
+            [blob for _, blob in candidates]
+        )
 
-        # Sort by similarity (highest first)
-        results.sort(key=lambda x: x[1], reverse=True)
+        # Top `limit` by similarity (highest first; ties keep query order).
+        # Partition around the limit-th score, then sort only the candidates
+        # scoring at least that much, so ties at the cut-off stay stable.
+        top = np.arange(len(similarities))
+        if 0 < limit < len(similarities):
+            cutoff = np.partition(similarities, -limit)[-limit]
+            top = np.flatnonzero(similarities >= cutoff)
+        order = top[np.argsort(-similarities[top], kind="stable")][:limit]
 
-        # Update access counts
-        for memory, _ in results[:limit]:
-            memory.access_count += 1
-            memory.last_accessed_at = datetime.utcnow()
+        top_ids = [candidates[i][0] for i in order]
+        memories = {
+            memory.id: memory
+            for memory in self.db.query(AgentMemory).filter(AgentMemory.id.in_(top_ids))
+        } if top_ids else {}
+        results = [(memories[candidates[i][0]], float(similarities[i])) for i in order]
 
-        self.db.commit()
+        self._record_access([memory for memory, _ in results])
 
-        return results[:limit]
+        return results
+
+    def _record_access(self, memories: List[AgentMemory]):
+        """
+        Bump access stats of retrieved memories in one UPDATE and commit
+
+        Reads that return nothing write nothing (no UPDATE, no commit).
+
+        Args:
+            memories: Memories that were returned to the caller
+        """
+        if not memories:
+            return
+
+        self.db.execute(
+            update(AgentMemory).where(
+                AgentMemory.id.in_([memory.id for memory in memories])
+            ).values(
+                access_count=AgentMemory.access_count + 1,
+                last_accessed_at=datetime.utcnow()
+            ).execution_options(synchronize_session=False)
+        )
+
+        # Commit expires the returned objects, so they reload the new values
+        self.db.commit()
 
     def get_relevant_context(
         self,
@@ -382,32 +452,56 @@ class AgentMemoryService:
         if not agent:
             return
 
-        # Get episodic memories
-        memories = self.db.query(AgentMemory).filter(
+        # Only the columns decay reads, not full ORM objects
+        memories = self.db.query(
+            AgentMemory.id,
+            AgentMemory.created_at,
+            AgentMemory.access_count,
+            AgentMemory.decay_rate,
+            AgentMemory.importance
+        ).filter(
             AgentMemory.agent_id == agent_id,
             AgentMemory.memory_type == MemoryType.EPISODIC
         ).all()
 
-        now = datetime.utcnow()
+        if not memories:
+            return
+
+        ids, created_at, access_counts, decay_rates, importances = zip(*memories)
+        importance = np.asarray(importances, dtype=np.float64)
 
-        for memory in memories:
-            # Calculate age in days
-            age_days = (now - memory.created_at).days
+        # Age in whole days (floored, like timedelta.days)
+        now = np.datetime64(datetime.utcnow(), "us")
+        age_days = (now - np.asarray(created_at, dtype="datetime64[us]")) // np.timedelta64(1, "D")
 
-            # Calculate decay factor
-            # Memories decay faster if rarely accessed
-            access_factor = 1.0 / (1.0 + memory.access_count)
-            age_factor = age_days / 30.0  # 30 days = full decay cycle
+        # Calculate decay factor
+        # Memories decay faster if rarely accessed
+        access_factor = 1.0 / (1.0 + np.asarray(access_counts, dtype=np.float64))
+        age_factor = age_days / 30.0  # 30 days = full decay cycle
 
-            decay_amount = memory.decay_rate * age_factor * access_factor
+        decay_amount = np.asarray(decay_rates, dtype=np.float64) * age_factor * access_factor
 
-            # Apply decay
-            new_importance = max(0.0, memory.importance - decay_amount)
-            memory.importance = new_importance
+        # Apply decay
+        new_importance = np.maximum(0.0, importance - decay_amount)
 
-            # Delete if importance drops too low
-            if new_importance < 0.1:
-                self.db.delete(memory)
+        # Delete if importance drops too low
+        doomed = new_importance < 0.1
+        changed = ~doomed & (new_importance != importance)
+
+        ids = np.asarray(ids)
+        doomed_ids = ids[doomed].tolist()
+        updates = [
+            {"id": memory_id, "importance": value}
+            for memory_id, value in zip(ids[changed].tolist(), new_importance[changed].tolist())
+        ]
+
+        # One executemany UPDATE and one DELETE instead of per-row flushes
+        if updates:
+            self.db.bulk_update_mappings(AgentMemory, updates)
+        if doomed_ids:
+            self.db.query(AgentMemory).filter(
+                AgentMemory.id.in_(doomed_ids)
+            ).delete(synchronize_session=False)
 
         self.db.commit()
 
@@ -450,13 +544,15 @@ class AgentMemoryService:
         if len(memories) < 2:
             return
 
-        # Find similar pairs (similarity > 0.9)
-        to_merge = []
-        for i, mem1 in enumerate(memories):
-            for mem2 in memories[i+1:]:
-                similarity = self._cosine_similarity(mem1.embedding, mem2.embedding)
-                if similarity > 0.9:
-                    to_merge.append((mem1, mem2, similarity))
+        # Find similar pairs (similarity > 0.9), vectorized, in the same
+        # order the pairwise loop visited them
+        to_merge = [
+            (memories[i], memories[j], similarity)
+            for i, j, similarity in self._similar_pairs(
+                [memory.embedding for memory in memories],
+                threshold=0.9
+            )
+        ]
 
         # Merge similar memories
         for mem1, mem2, similarity in to_merge:
@@ -490,26 +586,31 @@ class AgentMemoryService:
         Returns:
             Statistics dictionary
         """
-        total_memories = self.db.query(func.count(AgentMemory.id)).filter(
+        # Total and average importance in one aggregate query
+        total_memories, avg_importance = self.db.query(
+            func.count(AgentMemory.id),
+            func.avg(AgentMemory.importance)
+        ).filter(
             AgentMemory.agent_id == agent_id
-        ).scalar()
-
-        # Count by type
-        type_counts = {}
-        for memory_type in MemoryType:
-            count = self.db.query(func.count(AgentMemory.id)).filter(
-                AgentMemory.agent_id == agent_id,
-                AgentMemory.memory_type == memory_type
-            ).scalar()
-            type_counts[memory_type.value] = count
-
-        # Average importance
-        avg_importance = self.db.query(func.avg(AgentMemory.importance)).filter(
+        ).one()
+
+        # Count by type with one GROUP BY (types without rows stay 0)
+        type_counts = {memory_type.value: 0 for memory_type in MemoryType}
+        for memory_type, count in self.db.query(
+            AgentMemory.memory_type,
+            func.count(AgentMemory.id)
+        ).filter(
             AgentMemory.agent_id == agent_id
-        ).scalar()
+        ).group_by(AgentMemory.memory_type).all():
+            type_counts[memory_type.value] = count
 
         # Most accessed
-        most_accessed = self.db.query(AgentMemory).filter(
+        most_accessed = self.db.query(
+            AgentMemory.id,
+            AgentMemory.content,
+            AgentMemory.access_count,
+            AgentMemory.importance
+        ).filter(
             AgentMemory.agent_id == agent_id
         ).order_by(desc(AgentMemory.access_count)).limit(5).all()
 
@@ -541,26 +642,103 @@ class AgentMemoryService:
             text: Text to embed
 
         Returns:
-            Vector embedding (list of floats)
+            Vector embedding (list of floats, unit length)
         """
-        # TODO: Integrate with actual embedding service (OpenAI, Cohere, etc.)
-        # This is a placeholder that generates deterministic fake embeddings
+        # Cached per text; copy so callers can't mutate the cached vector
+        return list(_embed_text(text))
 
-        # Use hash for deterministic "embedding"
-        hash_obj = hashlib.sha256(text.encode())
-        hash_bytes = hash_obj.digest()
+    def _similarity_scores(
+        self,
+        query_embedding: List[float],
+        embeddings: List[bytes]
+    ) -> np.ndarray:
+        """
+        Cosine similarity of one query against many stored embeddings
 
-        # Convert to list of floats (normalized to [-1, 1])
-        embedding = [
-            (byte - 128) / 128.0
-            for byte in hash_bytes[:128]  # 128-dimensional embedding
-        ]
+        Same scores as _cosine_similarity per pair, computed as a single
+        matrix-vector product. The float32 bytes (as stored by
+        Float32Vector) are joined into one contiguous matrix without
+        materializing Python floats. Embeddings of another dimension,
+        and zero vectors, score 0.0.
 
-        # Pad to 128 dimensions if needed
-        while len(embedding) < 128:
-            embedding.append(0.0)
+        Args:
+            query_embedding: Query vector
+            embeddings: Candidate vectors as raw float32 bytes
 
-        return embedding
+        Returns:
+            Similarity scores (0-1), one per embedding
+        """
+        scores = np.zeros(len(embeddings))
+        query = np.asarray(query_embedding, dtype=np.float64)
+        width = query.size * np.dtype("<f4").itemsize
+        rows = [i for i, embedding in enumerate(embeddings) if len(embedding) == width]
+        if not rows:
+            return scores
+
+        matrix = np.frombuffer(
+            b"".join(embeddings[i] for i in rows), dtype="<f4"
+        ).reshape(len(rows), query.size).astype(np.float64)
+        magnitudes = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        nonzero = magnitudes > 0
+
+        similarity = np.zeros(len(rows))
+        similarity[nonzero] = (matrix[nonzero] @ query) / magnitudes[nonzero]
+        # Normalize to [0, 1], clamped against rounding
+        normalized = np.clip((similarity + 1.0) / 2.0, 0.0, 1.0)
+        scores[rows] = np.where(nonzero, normalized, 0.0)
+        return scores
+
+    def _similar_pairs(
+        self,
+        embeddings: List[List[float]],
+        threshold: float
+    ) -> List[Tuple[int, int, float]]:
+        """
+        Find all index pairs i < j whose similarity exceeds threshold
+
+        Vectors are unit-normalized once and compared block by block with
+        matrix products, so memory stays O(block * N) rather than O(N^2).
+        Only vectors of the same dimension are compared; zero vectors
+        never match (both as in _cosine_similarity).
+
+        Args:
+            embeddings: Vectors to compare
+            threshold: Minimum similarity (0-1), exclusive
+
+        Returns:
+            (i, j, similarity) tuples ordered by i, then j
+        """
+        by_dimension: Dict[int, List[int]] = {}
+        for index, embedding in enumerate(embeddings):
+            by_dimension.setdefault(len(embedding), []).append(index)
+
+        pairs = []
+        for indices in by_dimension.values():
+            if len(indices) < 2:
+                continue
+
+            matrix = np.asarray([embeddings[i] for i in indices], dtype=np.float64)
+            norms = np.linalg.norm(matrix, axis=1)
+            nonzero = norms > 0
+            unit = matrix[nonzero] / norms[nonzero, None]
+            positions = np.asarray(indices)[nonzero]
+
+            for start in range(0, len(unit), _PAIR_BLOCK_SIZE):
+                block = unit[start:start + _PAIR_BLOCK_SIZE]
+                similarity = np.clip((block @ unit.T + 1.0) / 2.0, 0.0, 1.0)
+                # Upper triangle only: column must come after the row
+                columns = np.arange(len(unit))
+                rows = np.arange(start, start + len(block))
+                mask = (similarity > threshold) & (columns[None, :] > rows[:, None])
+                for row, column in zip(*np.nonzero(mask)):
+                    pairs.append((
+                        int(positions[start + row]),
+                        int(positions[column]),
+                        float(similarity[row, column])
+                    ))
+
+        pairs.sort()
+        return pairs
 
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """
@@ -573,21 +751,18 @@ class AgentMemoryService:
         Returns:
             Similarity score (0-1)
         """
-        if len(vec1) != len(vec2):
+        a = np.asarray(vec1, dtype=np.float64)
+        b = np.asarray(vec2, dtype=np.float64)
+        if a.shape != b.shape:
             return 0.0
 
-        # Dot product
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-
         # Magnitudes
-        mag1 = sum(a * a for a in vec1) ** 0.5
-        mag2 = sum(b * b for b in vec2) ** 0.5
-
-        if mag1 == 0 or mag2 == 0:
+        magnitude = np.linalg.norm(a) * np.linalg.norm(b)
+        if magnitude == 0:
             return 0.0
 
-        # Cosine similarity
-        similarity = dot_product / (mag1 * mag2)
+        # Cosine similarity (one vectorized dot product)
+        similarity = float(np.dot(a, b) / magnitude)
 
-        # Normalize to [0, 1]
-        return (similarity + 1.0) / 2.0
+        # Normalize to [0, 1], clamped against rounding
+        return min(1.0, max(0.0, (similarity + 1.0) / 2.0))
@@ -12,7 +12,7 @@ Coordinates multi-agent workflows:
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, case, false, insert, literal, select, update
 
 from core.models import (
     Agent, AgentTask, AgentType, AgentRole,
@@ -103,22 +103,37 @@ class AgentOrchestrationService:
         Returns:
             List of created AgentTasks
         """
-        created_tasks = []
-
-        for task_data in tasks_data:
-            task = self.create_task(
-                project_id=project_id,
-                title=task_data["title"],
-                description=task_data["description"],
-                task_type=task_data.get("task_type"),
-                priority=task_data.get("priority", TaskPriority.MEDIUM),
-                context=task_data.get("context"),
-                depends_on=task_data.get("depends_on"),
-                deadline=task_data.get("deadline"),
-                auto_assign=auto_assign
-            )
-            created_tasks.append(task)
+        if not tasks_data:
+            return []
+
+        # One multi-row INSERT ... RETURNING (rows back in input order)
+        # instead of a unit-of-work flush, and one commit for the batch
+        created_tasks = self.db.execute(
+            insert(AgentTask).returning(AgentTask, sort_by_parameter_order=True),
+            [
+                {
+                    "project_id": project_id,
+                    "title": task_data["title"],
+                    "description": task_data["description"],
+                    "task_type": task_data.get("task_type"),
+                    "priority": task_data.get("priority", TaskPriority.MEDIUM),
+                    "context": task_data.get("context") or {},
+                    "depends_on": task_data.get("depends_on") or [],
+                    "deadline": task_data.get("deadline"),
+                    "status": TaskStatus.PENDING
+                }
+                for task_data in tasks_data
+            ]
+        ).scalars().all()
+
+        # Assign in order; autoflush lets each pick see earlier assignments
+        if auto_assign:
+            for task in created_tasks:
+                best_agent = self._find_best_agent_for_task(task)
+                if best_agent:
+                    self._apply_assignment(task, best_agent.id)
 
+        self.db.commit()
         return created_tasks
 
     # ==================== TASK ASSIGNMENT ====================
@@ -145,16 +160,19 @@ class AgentOrchestrationService:
         if not agent.is_active:
             raise ValueError(f"Agent {agent_id} is not active")
 
-        # Update task
-        task.agent_id = agent_id
-        task.status = TaskStatus.ASSIGNED
-        task.assigned_at = datetime.utcnow()
+        self._apply_assignment(task, agent_id)
 
         self.db.commit()
         self.db.refresh(task)
 
         return task
 
+    def _apply_assignment(self, task: AgentTask, agent_id: int) -> None:
+        """Mark task as assigned to agent (caller commits)"""
+        task.agent_id = agent_id
+        task.status = TaskStatus.ASSIGNED
+        task.assigned_at = datetime.utcnow()
+
     def _find_best_agent_for_task(self, task: AgentTask) -> Optional[Agent]:
         """
         Find best agent for a task based on:
@@ -204,19 +222,43 @@ class AgentOrchestrationService:
         if not candidates:
             return None
 
-        # Score each agent
-        scored_agents = []
-        for agent in candidates:
-            score = self._calculate_agent_score(agent, task)
-            scored_agents.append((agent, score))
+        # Workload of every candidate in one grouped query
+        active_counts = self._count_active_tasks([agent.id for agent in candidates])
 
-        # Sort by score (highest first)
-        scored_agents.sort(key=lambda x: x[1], reverse=True)
+        # Return best agent (highest score; first candidate wins ties)
+        return max(
+            candidates,
+            key=lambda agent: self._calculate_agent_score(
+                agent, task, active_tasks=active_counts.get(agent.id, 0)
+            )
+        )
+
+    def _count_active_tasks(self, agent_ids: List[int]) -> Dict[int, int]:
+        """
+        Count assigned/in-progress tasks per agent in a single query
 
-        # Return best agent
-        return scored_agents[0][0] if scored_agents else None
+        Args:
+            agent_ids: Agents to count for
 
-    def _calculate_agent_score(self, agent: Agent, task: AgentTask) -> float:
+        Returns:
+            Dict of agent_id -> active task count (agents without tasks omitted)
+        """
+        rows = self.db.query(
+            AgentTask.agent_id,
+            func.count(AgentTask.id)
+        ).filter(
+            AgentTask.agent_id.in_(agent_ids),
+            AgentTask.status.in_([TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS])
+        ).group_by(AgentTask.agent_id).all()
+
+        return dict(rows)
+
+    def _calculate_agent_score(
+        self,
+        agent: Agent,
+        task: AgentTask,
+        active_tasks: Optional[int] = None
+    ) -> float:
         """
         Calculate suitability score for agent-task pairing
 
@@ -229,6 +271,8 @@ class AgentOrchestrationService:
         Args:
             agent: Agent to score
             task: Task to assign
+            active_tasks: Agent's active task count, if already known
+                (queried when omitted)
 
         Returns:
             Score (higher is better)
@@ -244,10 +288,8 @@ class AgentOrchestrationService:
             score += agent.user_satisfaction_score * 20
 
         # Penalty for high workload
-        active_tasks = self.db.query(func.count(AgentTask.id)).filter(
-            AgentTask.agent_id == agent.id,
-            AgentTask.status.in_([TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS])
-        ).scalar()
+        if active_tasks is None:
+            active_tasks = self._count_active_tasks([agent.id]).get(agent.id, 0)
 
         if active_tasks == 0:
             score += 20  # Bonus for no active tasks
@@ -328,33 +370,44 @@ class AgentOrchestrationService:
         task.user_feedback = user_feedback
         task.user_rating = user_rating
 
-        # Update agent stats
+        # Update agent stats in one atomic UPDATE (no read-modify-write,
+        # so concurrent completions can't lose increments)
         if task.agent_id:
-            agent = self.db.query(Agent).filter(Agent.id == task.agent_id).first()
-            if agent:
-                agent.is_busy = False
-                agent.current_task_id = None
-                agent.tasks_completed += 1
-
-                # Update average completion time
-                if task.completion_time:
-                    if agent.average_completion_time:
-                        # Running average
-                        agent.average_completion_time = (
-                            agent.average_completion_time * 0.8 + task.completion_time * 0.2
-                        )
-                    else:
-                        agent.average_completion_time = task.completion_time
-
-                # Update satisfaction score
-                if user_rating is not None:
-                    if agent.user_satisfaction_score:
-                        # Running average (normalize rating from 0-5 to 0-1)
-                        agent.user_satisfaction_score = (
-                            agent.user_satisfaction_score * 0.8 + (user_rating / 5.0) * 0.2
-                        )
-                    else:
-                        agent.user_satisfaction_score = user_rating / 5.0
+            values = {
+                "is_busy": False,
+                "current_task_id": None,
+                "tasks_completed": Agent.tasks_completed + 1,
+            }
+
+            # Update average completion time
+            completion_time = task.completion_time
+            if completion_time:
+                # Running average
+                values["average_completion_time"] = case(
+                    (
+                        func.coalesce(Agent.average_completion_time, 0) != 0,
+                        Agent.average_completion_time * 0.8 + completion_time * 0.2
+                    ),
+                    else_=completion_time
+                )
+
+            # Update satisfaction score
+            if user_rating is not None:
+                # Running average (normalize rating from 0-5 to 0-1)
+                rating = user_rating / 5.0
+                values["user_satisfaction_score"] = case(
+                    (
+                        func.coalesce(Agent.user_satisfaction_score, 0) != 0,
+                        Agent.user_satisfaction_score * 0.8 + rating * 0.2
+                    ),
+                    else_=rating
+                )
+
+            self.db.execute(
+                update(Agent).where(
+                    Agent.id == task.agent_id
+                ).values(**values).execution_options(synchronize_session=False)
+            )
 
         self.db.commit()
         self.db.refresh(task)
@@ -381,33 +434,51 @@ class AgentOrchestrationService:
         Returns:
             Updated AgentTask
         """
-        task = self.db.query(AgentTask).filter(AgentTask.id == task_id).first()
+        # Update agent stats (the agent currently holding the task)
+        self.db.execute(
+            update(Agent).where(
+                Agent.id == select(AgentTask.agent_id).where(
+                    AgentTask.id == task_id
+                ).scalar_subquery()
+            ).values(
+                is_busy=False,
+                current_task_id=None,
+                tasks_failed=Agent.tasks_failed + 1
+            ).execution_options(synchronize_session=False)
+        )
+
+        # Count the attempt and decide retry vs. failure in the same
+        # atomic UPDATE, so concurrent failures can't lose a retry
+        status_type = AgentTask.status.type
+        failed = literal(TaskStatus.FAILED, status_type)
+        retrying = (
+            AgentTask.retry_count + 1 < AgentTask.max_retries
+            if auto_retry else false()
+        )
+        task = self.db.execute(
+            update(AgentTask).where(
+                AgentTask.id == task_id
+            ).values(
+                error_message=error_message,
+                retry_count=AgentTask.retry_count + 1,
+                # Retry if under limit (unassigned; will be reassigned)
+                status=case(
+                    (retrying, literal(TaskStatus.PENDING, status_type)),
+                    else_=failed
+                ),
+                agent_id=case((retrying, None), else_=AgentTask.agent_id),
+                assigned_at=case((retrying, None), else_=AgentTask.assigned_at)
+            ).returning(AgentTask)
+        ).scalar_one_or_none()
         if not task:
+            self.db.rollback()
             raise ValueError(f"Task {task_id} not found")
 
-        task.error_message = error_message
-        task.retry_count += 1
-
-        # Update agent stats
-        if task.agent_id:
-            agent = self.db.query(Agent).filter(Agent.id == task.agent_id).first()
-            if agent:
-                agent.is_busy = False
-                agent.current_task_id = None
-                agent.tasks_failed += 1
-
-        # Retry if under limit
-        if auto_retry and task.retry_count < task.max_retries:
-            task.status = TaskStatus.PENDING
-            task.agent_id = None  # Will be reassigned
-            task.assigned_at = None
-
-            # Find new agent (avoid previous one)
+        if task.status == TaskStatus.PENDING:
+            # Find new agent
             best_agent = self._find_best_agent_for_task(task)
-            if best_agent and best_agent.id != task.agent_id:
+            if best_agent:
                 self.assign_task(task.id, best_agent.id)
-        else:
-            task.status = TaskStatus.FAILED
 
         self.db.commit()
         self.db.refresh(task)
@@ -444,20 +515,32 @@ class AgentOrchestrationService:
             completed_task_id: ID of completed task
         """
         # Find all tasks that depend on this one
-        blocked_tasks = self.db.query(AgentTask).filter(
-            AgentTask.status == TaskStatus.BLOCKED
-        ).all()
+        blocked_tasks = [
+            task for task in self.db.query(AgentTask).filter(
+                AgentTask.status == TaskStatus.BLOCKED
+            ).all()
+            if completed_task_id in task.depends_on
+        ]
+
+        # Completion status of every dependency involved, in one query
+        dependency_ids = {dep_id for task in blocked_tasks for dep_id in task.depends_on}
+        completed_ids = {
+            task_id for (task_id,) in self.db.query(AgentTask.id).filter(
+                AgentTask.id.in_(dependency_ids),
+                AgentTask.status == TaskStatus.COMPLETED
+            )
+        } if dependency_ids else set()
 
         for task in blocked_tasks:
-            if completed_task_id in task.depends_on:
-                # Check if all dependencies are now complete
-                if self._check_dependencies_complete(task):
-                    task.status = TaskStatus.PENDING
+            # Check if all dependencies are now complete (same rule as
+            # _check_dependencies_complete)
+            if len(completed_ids.intersection(task.depends_on)) == len(task.depends_on):
+                task.status = TaskStatus.PENDING
 
-                    # Auto-assign if possible
-                    best_agent = self._find_best_agent_for_task(task)
-                    if best_agent:
-                        self.assign_task(task.id, best_agent.id)
+                # Auto-assign if possible
+                best_agent = self._find_best_agent_for_task(task)
+                if best_agent:
+                    self.assign_task(task.id, best_agent.id)
 
         self.db.commit()
 
@@ -497,24 +580,29 @@ class AgentOrchestrationService:
         if priority:
             query = query.filter(AgentTask.priority == priority)
 
-        # Sort by priority (critical first) then deadline
-        priority_order = {
-            TaskPriority.CRITICAL: 0,
-            TaskPriority.HIGH: 1,
-            TaskPriority.MEDIUM: 2,
-            TaskPriority.LOW: 3
-        }
-
-        tasks = query.limit(limit).all()
-
-        # Sort in Python for complex sorting
-        tasks.sort(key=lambda t: (
-            priority_order.get(t.priority, 999),
-            t.deadline if t.deadline else datetime.max,
-            t.created_at
-        ))
+        # Sort by priority (critical first) then deadline (none last),
+        # in SQL so the limit keeps the most urgent tasks
+        priority_rank = case(
+            *[
+                (literal(task_priority, AgentTask.priority.type), rank)
+                for rank, task_priority in enumerate((
+                    TaskPriority.CRITICAL,
+                    TaskPriority.HIGH,
+                    TaskPriority.MEDIUM,
+                    TaskPriority.LOW
+                ))
+            ],
+            value=AgentTask.priority,
+            else_=999
+        )
 
-        return tasks
+        return query.order_by(
+            priority_rank,
+            AgentTask.deadline.is_(None),
+            AgentTask.deadline,
+            AgentTask.created_at,
+            AgentTask.id
+        ).limit(limit).all()
 
     def get_next_task(self, agent_id: int) -> Optional[AgentTask]:
         """
@@ -557,27 +645,24 @@ class AgentOrchestrationService:
         Returns:
             Statistics dictionary
         """
-        total_tasks = self.db.query(func.count(AgentTask.id)).filter(
+        # Count by status and priority in one grouped query
+        status_counts = {status.value: 0 for status in TaskStatus}
+        priority_counts = {priority.value: 0 for priority in TaskPriority}
+        grouped = self.db.query(
+            AgentTask.status,
+            AgentTask.priority,
+            func.count(AgentTask.id)
+        ).filter(
             AgentTask.project_id == project_id
-        ).scalar()
-
-        # Count by status
-        status_counts = {}
-        for status in TaskStatus:
-            count = self.db.query(func.count(AgentTask.id)).filter(
-                AgentTask.project_id == project_id,
-                AgentTask.status == status
-            ).scalar()
-            status_counts[status.value] = count
-
-        # Count by priority
-        priority_counts = {}
-        for priority in TaskPriority:
-            count = self.db.query(func.count(AgentTask.id)).filter(
-                AgentTask.project_id == project_id,
-                AgentTask.priority == priority
-            ).scalar()
-            priority_counts[priority.value] = count
+        ).group_by(AgentTask.status, AgentTask.priority).all()
+
+        total_tasks = 0
+        for status, priority, count in grouped:
+            total_tasks += count
+            if status is not None:
+                status_counts[status.value] += count
+            if priority is not None:
+                priority_counts[priority.value] += count
 
         # Average completion time
         avg_completion = self.db.query(func.avg(
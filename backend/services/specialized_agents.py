@@ -9,7 +9,7 @@ Concrete implementations of AI agents with specialized capabilities:
 - QCAgent: Quality control and review
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Type
 from abc import ABC, abstractmethod
 from sqlalchemy.orm import Session
 
@@ -63,9 +63,11 @@ class BaseAgent(ABC):
         # Add project info
         context["project_id"] = self.project_id
 
-        # Add chapter info if available
+        # Add chapter info if available (only the columns the context uses)
         if "chapter_id" in context:
-            chapter = self.db.query(Chapter).filter(
+            chapter = self.db.query(
+                Chapter.id, Chapter.chapter_number, Chapter.title, Chapter.content
+            ).filter(
                 Chapter.id == context["chapter_id"]
             ).first()
             if chapter:
@@ -220,7 +222,10 @@ Always provide actionable suggestions with specific chapter/scene references."""
 
     def _check_pacing(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Check story pacing"""
-        chapters = self.db.query(Chapter).filter(
+        # Only the columns the scan reads, not full Chapter entities
+        chapters = self.db.query(
+            Chapter.id, Chapter.chapter_number, Chapter.content
+        ).filter(
             Chapter.project_id == self.project_id
         ).order_by(Chapter.chapter_number).all()
 
@@ -700,6 +705,16 @@ Focus on high-level quality rather than minor details."""
 
 # ==================== AGENT FACTORY ====================
 
+# Specialized implementation per agent type (built once, not per call)
+_AGENT_CLASSES: Dict[AgentType, Type[BaseAgent]] = {
+    AgentType.PLOTTING: PlottingAgent,
+    AgentType.CHARACTER: CharacterAgent,
+    AgentType.DIALOGUE: DialogueAgent,
+    AgentType.CONTINUITY: ContinuityAgent,
+    AgentType.QC: QCAgent,
+}
+
+
 class AgentFactory:
     """Factory for creating specialized agent instances"""
 
@@ -715,15 +730,7 @@ class AgentFactory:
         Returns:
             Specialized agent instance
         """
-        agent_classes = {
-            AgentType.PLOTTING: PlottingAgent,
-            AgentType.CHARACTER: CharacterAgent,
-            AgentType.DIALOGUE: DialogueAgent,
-            AgentType.CONTINUITY: ContinuityAgent,
-            AgentType.QC: QCAgent,
-        }
-
-        agent_class = agent_classes.get(agent.agent_type)
+        agent_class = _AGENT_CLASSES.get(agent.agent_type)
         if not agent_class:
             raise ValueError(f"Unknown agent type: {agent.agent_type}")
 
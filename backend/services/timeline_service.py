@@ -3,29 +3,100 @@ Timeline Service
 
 Aggregates and manages timeline data from multiple sources
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
-from typing import List, Optional, Dict, Any, Set
-from datetime import datetime
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, or_, func, case, insert, update, literal, Text
+from sqlalchemy.dialects.postgresql import array
+from typing import List, Optional, Dict, Any, Set, Tuple, Iterator
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import groupby, islice
+from operator import attrgetter
+from types import MappingProxyType
+import csv
+import enum
 import hashlib
+import io
 import json
+import os
+
+import numpy as np
 
 from core.models.timeline import (
     TimelineEvent,
     TimelineConflict,
     TimelineView,
     TimelineBookmark,
+    TimelineSyncState,
     TimelineEventType,
     TimelineLayer,
     ConflictType,
     ConflictSeverity,
 )
 from core.models.chapter import Chapter
-from core.models.consequences import StoryEvent, Consequence
+from core.models.consequences import StoryEvent, Consequence, ConsequenceStatus
 from core.models.character_arcs import CharacterArc, ArcMilestone
 from core.models.planner import BookArc
 
 
+# Run the per-source syncs concurrently (needs a server DB; SQLite can't take concurrent writers)
+PARALLEL_SYNC = os.getenv("TIMELINE_PARALLEL_SYNC", "False").lower() == "true"
+
+# Source rows streamed / written per round-trip during sync
+_SYNC_BATCH_SIZE = 1000
+
+# Incremental syncs re-read rows this far behind the stored watermark.
+# updated_at is stamped by the app at flush, not at commit, so a row can
+# become visible with a timestamp the watermark has already passed (a
+# slow transaction, or clock skew between workers). Unchanged rows in
+# the overlap are skipped by their sync_hash.
+_WATERMARK_LAG = timedelta(minutes=5)
+
+# New-event batches at least this large are written with COPY (PostgreSQL/psycopg2 only)
+_COPY_THRESHOLD = 100
+
+# Source phases of sync_project_timeline, each handled by _sync_<name>
+_SYNC_SOURCES = ("chapters", "story_events", "milestones", "beats", "consequences")
+
+# TimelineConflict.status values, counted separately in the detection signature
+_CONFLICT_STATUSES = ("open", "acknowledged", "resolved", "ignored")
+
+_DEFAULT_EVENT_COLOR = "#6B7280"
+
+# Story event colors by StoryEvent.event_type
+_EVENT_COLORS = MappingProxyType({
+    "decision": "#3B82F6",  # Blue
+    "revelation": "#FBBF24",  # Yellow
+    "conflict": "#EF4444",  # Red
+    "resolution": "#10B981",  # Green
+    "discovery": "#8B5CF6",  # Purple
+    "loss": "#DC2626",  # Dark red
+    "transformation": "#EC4899",  # Pink
+})
+
+# Character arc milestone colors by ArcMilestone.milestone_type
+_MILESTONE_COLORS = MappingProxyType({
+    "inciting_incident": "#3B82F6",
+    "turning_point": "#8B5CF6",
+    "crisis": "#F59E0B",
+    "climax": "#DC2626",
+    "resolution": "#10B981",
+    "revelation": "#FBBF24",
+    "setback": "#6B7280",
+    "triumph": "#059669",
+})
+
+# BookArc beat columns and their colors, in story order
+_BEAT_SPECS = (
+    ("inciting_incident", "#F59E0B"),
+    ("first_plot_point", "#3B82F6"),
+    ("midpoint", "#8B5CF6"),
+    ("all_is_lost", "#DC2626"),
+    ("climax", "#DC2626"),
+    ("resolution", "#10B981"),
+)
+
+
 class TimelineService:
     """
     Service for timeline management and visualization
@@ -39,301 +110,409 @@ class TimelineService:
 
     def __init__(self, db: Session):
         self.db = db
+        # Chapters touched by the current sync (scopes conflict detection)
+        self.synced_chapters: Set[int] = set()
 
     # ==================== Aggregation & Sync ====================
 
-    def sync_project_timeline(self, project_id: int) -> Dict[str, int]:
+    def sync_project_timeline(self, project_id: int, force_full_sync: bool = False) -> Dict[str, int]:
         """
         Sync all timeline events for a project from source tables
 
+        Only source rows updated since the last sync are read, unless
+        force_full_sync is set.
+
         Returns counts of synced events by type
         """
-        counts = {
-            "chapters": self._sync_chapters(project_id),
-            "story_events": self._sync_story_events(project_id),
-            "milestones": self._sync_milestones(project_id),
-            "beats": self._sync_beats(project_id),
-            "consequences": self._sync_consequences(project_id),
-        }
-
-        # After sync, detect conflicts
-        self.detect_all_conflicts(project_id)
+        self.synced_chapters = set()
+        if PARALLEL_SYNC and self.db.get_bind().dialect.name != "sqlite":
+            counts = self._sync_sources_parallel(project_id, force_full_sync)
+            # Workers wrote (and committed) through their own sessions
+            self.db.expire_all()
+        else:
+            # All phases plus conflict detection share one transaction
+            try:
+                counts = {
+                    "chapters": self._sync_chapters(project_id, force_full_sync),
+                    "story_events": self._sync_story_events(project_id, force_full_sync),
+                    "milestones": self._sync_milestones(project_id, force_full_sync),
+                    "beats": self._sync_beats(project_id, force_full_sync),
+                    "consequences": self._sync_consequences(project_id, force_full_sync),
+                }
+            except Exception:
+                self.db.rollback()
+                raise
+
+        # Nothing changed since the last sync, so conflicts can't have either
+        if not force_full_sync and sum(counts.values()) == 0:
+            self.db.commit()  # Watermarks may still have moved
+            return counts
+
+        # After sync, detect conflicts (only where events changed, unless forced);
+        # this commits the sync too
+        self.detect_all_conflicts(
+            project_id,
+            chapters=None if force_full_sync else self.synced_chapters
+        )
 
         return counts
 
-    def _sync_chapters(self, project_id: int) -> int:
+    def _sync_sources_parallel(self, project_id: int, force_full_sync: bool = False) -> Dict[str, int]:
+        """
+        Run the per-source syncs concurrently
+
+        The sources read disjoint tables and write disjoint event types, so
+        each runs on its own session/connection; wall time becomes roughly
+        the slowest phase instead of the sum.
+        """
+        bind = self.db.get_bind()
+
+        def run(source: str) -> Tuple[int, Set[int]]:
+            session = Session(bind=bind)
+            try:
+                service = TimelineService(session)
+                count = getattr(service, f"_sync_{source}")(project_id, force_full_sync)
+                session.commit()
+                return count, service.synced_chapters
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+        with ThreadPoolExecutor(max_workers=len(_SYNC_SOURCES)) as executor:
+            futures = {source: executor.submit(run, source) for source in _SYNC_SOURCES}
+            counts = {}
+            for source, future in futures.items():
+                counts[source], chapters = future.result()
+                self.synced_chapters.update(chapters)
+            return counts
+
+    def _sync_chapters(self, project_id: int, force_full_sync: bool = False) -> int:
         """Sync chapters to timeline events"""
-        chapters = self.db.query(Chapter).filter(
+        now = datetime.utcnow()
+        watermark = self._get_watermark(project_id, "chapters", force_full_sync)
+        query = self.db.query(Chapter).filter(
             Chapter.project_id == project_id
-        ).all()
+        )
+        if watermark is not None:
+            query = query.filter(Chapter.updated_at > watermark)
 
         synced_count = 0
-        for chapter in chapters:
+        new_watermark = None
+        for chapters in self._iter_batches(query):
             # Calculate hash of source data
-            source_hash = self._calculate_hash({
-                "title": chapter.title,
-                "chapter_number": chapter.chapter_number,
-                "status": chapter.status,
-                "word_count": chapter.word_count,
-            })
-
-            # Check if event exists
-            existing = self.db.query(TimelineEvent).filter(
-                TimelineEvent.project_id == project_id,
-                TimelineEvent.event_type == TimelineEventType.CHAPTER,
-                TimelineEvent.source_id == chapter.id
-            ).first()
+            source_hashes = {
+                chapter.id: self._hash_fields(
+                    chapter.title,
+                    chapter.chapter_number,
+                    chapter.status,
+                    chapter.word_count,
+                )
+                for chapter in chapters
+            }
+            stale_ids, known_source_ids = self._load_stale_events(
+                project_id, TimelineEventType.CHAPTER, source_hashes
+            )
 
-            if existing:
-                # Update if hash changed
-                if existing.sync_hash != source_hash:
-                    existing.chapter_number = chapter.chapter_number
-                    existing.title = chapter.title or f"Chapter {chapter.chapter_number}"
-                    existing.description = chapter.summary
-                    existing.metadata = {
-                        "chapter": {
-                            "word_count": chapter.word_count,
-                            "target_word_count": chapter.target_word_count,
-                            "status": chapter.status,
-                            "pov_character_id": chapter.pov_character_id,
-                            "is_published": chapter.is_published,
-                        }
+            inserts = []
+            updates = []
+            for chapter in chapters:
+                source_hash = source_hashes[chapter.id]
+                event_id = stale_ids.get(chapter.id)
+                if event_id is None and chapter.id in known_source_ids:
+                    continue  # Unchanged since the last sync
+
+                event_metadata = {
+                    "chapter": {
+                        "word_count": chapter.word_count,
+                        "target_word_count": chapter.target_word_count,
+                        "status": chapter.status,
+                        "pov_character_id": chapter.pov_character_id,
+                        "is_published": chapter.is_published,
                     }
-                    existing.sync_hash = source_hash
-                    existing.last_synced_at = datetime.utcnow()
+                }
+
+                if event_id is not None:
+                    updates.append({
+                        "id": event_id,
+                        "chapter_number": chapter.chapter_number,
+                        "title": chapter.title or f"Chapter {chapter.chapter_number}",
+                        "description": chapter.summary,
+                        "event_metadata": event_metadata,
+                        "sync_hash": source_hash,
+                        "last_synced_at": now,
+                    })
+                    synced_count += 1
+                else:
+                    inserts.append({
+                        "project_id": project_id,
+                        "event_type": TimelineEventType.CHAPTER,
+                        "source_id": chapter.id,
+                        "source_table": "chapters",
+                        "chapter_number": chapter.chapter_number,
+                        "title": chapter.title or f"Chapter {chapter.chapter_number}",
+                        "description": chapter.summary,
+                        "layer": TimelineLayer.TECHNICAL,
+                        "color": _DEFAULT_EVENT_COLOR,
+                        "icon": "book",
+                        "magnitude": 0.3,
+                        "related_characters": [chapter.pov_character_id] if chapter.pov_character_id else [],
+                        "event_metadata": event_metadata,
+                        "sync_hash": source_hash,
+                        "last_synced_at": now,
+                        "is_custom": False,
+                    })
                     synced_count += 1
-            else:
-                # Create new event
-                new_event = TimelineEvent(
-                    project_id=project_id,
-                    event_type=TimelineEventType.CHAPTER,
-                    source_id=chapter.id,
-                    source_table="chapters",
-                    chapter_number=chapter.chapter_number,
-                    title=chapter.title or f"Chapter {chapter.chapter_number}",
-                    description=chapter.summary,
-                    layer=TimelineLayer.TECHNICAL,
-                    color="#6B7280",
-                    icon="book",
-                    magnitude=0.3,
-                    related_characters=[chapter.pov_character_id] if chapter.pov_character_id else [],
-                    metadata={
-                        "chapter": {
-                            "word_count": chapter.word_count,
-                            "target_word_count": chapter.target_word_count,
-                            "status": chapter.status,
-                            "pov_character_id": chapter.pov_character_id,
-                            "is_published": chapter.is_published,
-                        }
-                    },
-                    sync_hash=source_hash,
-                    last_synced_at=datetime.utcnow(),
-                    is_custom=False
-                )
-                self.db.add(new_event)
-                synced_count += 1
 
-        self.db.commit()
+            self._write_batch(inserts, updates)
+
+            new_watermark = max(new_watermark or datetime.min, *(c.updated_at for c in chapters))
+
+        self._set_watermark(project_id, "chapters", new_watermark)
         return synced_count
 
-    def _sync_story_events(self, project_id: int) -> int:
+    def _sync_story_events(self, project_id: int, force_full_sync: bool = False) -> int:
         """Sync story events to timeline events"""
-        story_events = self.db.query(StoryEvent).filter(
+        now = datetime.utcnow()
+        watermark = self._get_watermark(project_id, "story_events", force_full_sync)
+        query = self.db.query(StoryEvent).filter(
             StoryEvent.project_id == project_id
-        ).all()
+        )
+        if watermark is not None:
+            query = query.filter(StoryEvent.updated_at > watermark)
 
         synced_count = 0
-        for event in story_events:
-            if not event.chapter_number:
-                continue  # Skip events without chapter position
-
-            source_hash = self._calculate_hash({
-                "title": event.title,
-                "event_type": event.event_type.value,
-                "magnitude": event.magnitude,
-                "chapter_number": event.chapter_number,
-            })
-
-            existing = self.db.query(TimelineEvent).filter(
-                TimelineEvent.project_id == project_id,
-                TimelineEvent.event_type == TimelineEventType.STORY_EVENT,
-                TimelineEvent.source_id == event.id
-            ).first()
-
-            # Determine color based on event type
-            event_colors = {
-                "decision": "#3B82F6",  # Blue
-                "revelation": "#FBBF24",  # Yellow
-                "conflict": "#EF4444",  # Red
-                "resolution": "#10B981",  # Green
-                "discovery": "#8B5CF6",  # Purple
-                "loss": "#DC2626",  # Dark red
-                "transformation": "#EC4899",  # Pink
+        new_watermark = None
+        for story_events in self._iter_batches(query):
+            source_hashes = {
+                event.id: self._hash_fields(
+                    event.title,
+                    event.event_type.value,
+                    event.magnitude,
+                    event.chapter_number,
+                )
+                for event in story_events
+                if event.chapter_number  # Skip events without chapter position
             }
-            color = event_colors.get(event.event_type.value, "#6B7280")
+            stale_ids, known_source_ids = self._load_stale_events(
+                project_id, TimelineEventType.STORY_EVENT, source_hashes
+            )
 
-            if existing:
-                if existing.sync_hash != source_hash:
-                    existing.chapter_number = event.chapter_number
-                    existing.title = event.title
-                    existing.description = event.description
-                    existing.magnitude = event.magnitude
-                    existing.color = color
-                    existing.metadata = {
-                        "story_event": {
-                            "event_type": event.event_type.value,
-                            "emotional_impact": event.emotional_impact,
-                            "causes": event.causes,
-                            "effects": event.effects,
-                        }
+            inserts = []
+            updates = []
+            for event in story_events:
+                if event.id not in source_hashes:
+                    continue
+
+                source_hash = source_hashes[event.id]
+                event_id = stale_ids.get(event.id)
+                if event_id is None and event.id in known_source_ids:
+                    continue  # Unchanged since the last sync
+
+                # Determine color based on event type
+                color = _EVENT_COLORS.get(event.event_type.value, _DEFAULT_EVENT_COLOR)
+
+                event_metadata = {
+                    "story_event": {
+                        "event_type": event.event_type.value,
+                        "emotional_impact": event.emotional_impact,
+                        "causes": event.causes,
+                        "effects": event.effects,
                     }
-                    existing.sync_hash = source_hash
-                    existing.last_synced_at = datetime.utcnow()
+                }
+
+                if event_id is not None:
+                    updates.append({
+                        "id": event_id,
+                        "chapter_number": event.chapter_number,
+                        "title": event.title,
+                        "description": event.description,
+                        "magnitude": event.magnitude,
+                        "color": color,
+                        "event_metadata": event_metadata,
+                        "sync_hash": source_hash,
+                        "last_synced_at": now,
+                    })
+                    synced_count += 1
+                else:
+                    inserts.append({
+                        "project_id": project_id,
+                        "event_type": TimelineEventType.STORY_EVENT,
+                        "source_id": event.id,
+                        "source_table": "story_events",
+                        "chapter_number": event.chapter_number,
+                        "title": event.title,
+                        "description": event.description,
+                        "layer": TimelineLayer.PLOT,
+                        "color": color,
+                        "icon": "zap",
+                        "magnitude": event.magnitude,
+                        "is_major_beat": event.magnitude > 0.7,
+                        "event_metadata": event_metadata,
+                        "sync_hash": source_hash,
+                        "last_synced_at": now,
+                        "is_custom": False,
+                    })
                     synced_count += 1
-            else:
-                new_event = TimelineEvent(
-                    project_id=project_id,
-                    event_type=TimelineEventType.STORY_EVENT,
-                    source_id=event.id,
-                    source_table="story_events",
-                    chapter_number=event.chapter_number,
-                    title=event.title,
-                    description=event.description,
-                    layer=TimelineLayer.PLOT,
-                    color=color,
-                    icon="zap",
-                    magnitude=event.magnitude,
-                    is_major_beat=event.magnitude > 0.7,
-                    metadata={
-                        "story_event": {
-                            "event_type": event.event_type.value,
-                            "emotional_impact": event.emotional_impact,
-                            "causes": event.causes,
-                            "effects": event.effects,
-                        }
-                    },
-                    sync_hash=source_hash,
-                    last_synced_at=datetime.utcnow(),
-                    is_custom=False
-                )
-                self.db.add(new_event)
-                synced_count += 1
 
-        self.db.commit()
+            self._write_batch(inserts, updates)
+
+            new_watermark = max(new_watermark or datetime.min, *(e.updated_at for e in story_events))
+
+        self._set_watermark(project_id, "story_events", new_watermark)
         return synced_count
 
-    def _sync_milestones(self, project_id: int) -> int:
+    def _sync_milestones(self, project_id: int, force_full_sync: bool = False) -> int:
         """Sync character arc milestones to timeline events"""
-        milestones = self.db.query(ArcMilestone).join(
+        now = datetime.utcnow()
+        watermark = self._get_watermark(project_id, "arc_milestones", force_full_sync)
+        # Arc columns come along in the same row (no per-milestone arc lookup)
+        query = self.db.query(
+            ArcMilestone,
+            CharacterArc.character_id,
+            CharacterArc.updated_at.label("arc_updated_at")
+        ).join(
             CharacterArc
         ).filter(
             CharacterArc.project_id == project_id
-        ).all()
+        )
+        if watermark is not None:
+            # Arc changes (e.g. character_id) also affect the milestone event
+            query = query.filter(or_(
+                ArcMilestone.updated_at > watermark,
+                CharacterArc.updated_at > watermark
+            ))
 
         synced_count = 0
-        for milestone in milestones:
-            source_hash = self._calculate_hash({
-                "milestone_type": milestone.milestone_type.value,
-                "chapter_number": milestone.chapter_number,
-                "description": milestone.description,
-                "significance": milestone.significance,
-            })
-
-            existing = self.db.query(TimelineEvent).filter(
-                TimelineEvent.project_id == project_id,
-                TimelineEvent.event_type == TimelineEventType.MILESTONE,
-                TimelineEvent.source_id == milestone.id
-            ).first()
-
-            # Get character arc to get character_id
-            arc = self.db.query(CharacterArc).filter(
-                CharacterArc.id == milestone.arc_id
-            ).first()
-
-            milestone_colors = {
-                "inciting_incident": "#3B82F6",
-                "turning_point": "#8B5CF6",
-                "crisis": "#F59E0B",
-                "climax": "#DC2626",
-                "resolution": "#10B981",
-                "revelation": "#FBBF24",
-                "setback": "#6B7280",
-                "triumph": "#059669",
+        new_watermark = None
+        for rows in self._iter_batches(query):
+            source_hashes = {
+                milestone.id: self._hash_fields(
+                    milestone.milestone_type.value,
+                    milestone.chapter_number,
+                    milestone.description,
+                    milestone.significance,
+                    character_id,
+                )
+                for milestone, character_id, _ in rows
             }
-            color = milestone_colors.get(milestone.milestone_type.value, "#6B7280")
+            stale_ids, known_source_ids = self._load_stale_events(
+                project_id, TimelineEventType.MILESTONE, source_hashes
+            )
 
-            if existing:
-                if existing.sync_hash != source_hash:
-                    existing.chapter_number = milestone.chapter_number
-                    existing.title = f"{milestone.milestone_type.value.replace('_', ' ').title()}"
-                    existing.description = milestone.description
-                    existing.magnitude = milestone.significance / 5.0  # Convert 1-5 to 0-1
-                    existing.color = color
-                    existing.related_characters = [arc.character_id] if arc else []
-                    existing.metadata = {
-                        "milestone": {
-                            "arc_id": milestone.arc_id,
-                            "milestone_type": milestone.milestone_type.value,
-                            "significance": milestone.significance,
-                            "notes": milestone.notes,
-                        }
+            inserts = []
+            updates = []
+            for milestone, character_id, _ in rows:
+                source_hash = source_hashes[milestone.id]
+                event_id = stale_ids.get(milestone.id)
+                if event_id is None and milestone.id in known_source_ids:
+                    continue  # Unchanged since the last sync
+
+                color = _MILESTONE_COLORS.get(milestone.milestone_type.value, _DEFAULT_EVENT_COLOR)
+
+                event_metadata = {
+                    "milestone": {
+                        "arc_id": milestone.arc_id,
+                        "milestone_type": milestone.milestone_type.value,
+                        "significance": milestone.significance,
+                        "notes": milestone.notes,
                     }
-                    existing.sync_hash = source_hash
-                    existing.last_synced_at = datetime.utcnow()
+                }
+
+                if event_id is not None:
+                    updates.append({
+                        "id": event_id,
+                        "chapter_number": milestone.chapter_number,
+                        "title": f"{milestone.milestone_type.value.replace('_', ' ').title()}",
+                        "description": milestone.description,
+                        "magnitude": milestone.significance / 5.0,  # Convert 1-5 to 0-1
+                        "color": color,
+                        "related_characters": [character_id],
+                        "event_metadata": event_metadata,
+                        "sync_hash": source_hash,
+                        "last_synced_at": now,
+                    })
+                    synced_count += 1
+                else:
+                    inserts.append({
+                        "project_id": project_id,
+                        "event_type": TimelineEventType.MILESTONE,
+                        "source_id": milestone.id,
+                        "source_table": "arc_milestones",
+                        "chapter_number": milestone.chapter_number,
+                        "title": f"{milestone.milestone_type.value.replace('_', ' ').title()}",
+                        "description": milestone.description,
+                        "layer": TimelineLayer.CHARACTER,
+                        "color": color,
+                        "icon": "flag",
+                        "magnitude": milestone.significance / 5.0,
+                        "is_major_beat": milestone.significance >= 4,
+                        "related_characters": [character_id],
+                        "event_metadata": event_metadata,
+                        "sync_hash": source_hash,
+                        "last_synced_at": now,
+                        "is_custom": False,
+                    })
                     synced_count += 1
-            else:
-                new_event = TimelineEvent(
-                    project_id=project_id,
-                    event_type=TimelineEventType.MILESTONE,
-                    source_id=milestone.id,
-                    source_table="arc_milestones",
-                    chapter_number=milestone.chapter_number,
-                    title=f"{milestone.milestone_type.value.replace('_', ' ').title()}",
-                    description=milestone.description,
-                    layer=TimelineLayer.CHARACTER,
-                    color=color,
-                    icon="flag",
-                    magnitude=milestone.significance / 5.0,
-                    is_major_beat=milestone.significance >= 4,
-                    related_characters=[arc.character_id] if arc else [],
-                    metadata={
-                        "milestone": {
-                            "arc_id": milestone.arc_id,
-                            "milestone_type": milestone.milestone_type.value,
-                            "significance": milestone.significance,
-                            "notes": milestone.notes,
-                        }
-                    },
-                    sync_hash=source_hash,
-                    last_synced_at=datetime.utcnow(),
-                    is_custom=False
-                )
-                self.db.add(new_event)
-                synced_count += 1
 
-        self.db.commit()
+            self._write_batch(inserts, updates)
+
+            new_watermark = max(
+                new_watermark or datetime.min,
+                *(max(m.updated_at, arc_updated_at) for m, _, arc_updated_at in rows)
+            )
+
+        self._set_watermark(
+            project_id,
+            "arc_milestones",
+            new_watermark
+        )
         return synced_count
 
-    def _sync_beats(self, project_id: int) -> int:
+    def _sync_beats(self, project_id: int, force_full_sync: bool = False) -> int:
         """Sync book arc story beats to timeline events"""
-        book_arc = self.db.query(BookArc).filter(
+        now = datetime.utcnow()
+        watermark = self._get_watermark(project_id, "book_arcs", force_full_sync)
+        query = self.db.query(BookArc).filter(
             BookArc.project_id == project_id
-        ).first()
+        )
+        if watermark is not None:
+            query = query.filter(BookArc.updated_at > watermark)
+        book_arc = query.first()
 
         if not book_arc:
             return 0
 
-        synced_count = 0
-        beats = [
-            ("inciting_incident", book_arc.inciting_incident, "#F59E0B"),
-            ("first_plot_point", book_arc.first_plot_point, "#3B82F6"),
-            ("midpoint", book_arc.midpoint, "#8B5CF6"),
-            ("all_is_lost", book_arc.all_is_lost, "#DC2626"),
-            ("climax", book_arc.climax, "#DC2626"),
-            ("resolution", book_arc.resolution, "#10B981"),
-        ]
+        # All beats come from this one row; if none of their fields changed
+        # (e.g. only the arc's title did) there is nothing to do per beat
+        signature = self._hash_fields(
+            book_arc.act1_end_chapter,
+            book_arc.act2_end_chapter,
+            *(getattr(book_arc, beat_name) for beat_name, _ in _BEAT_SPECS)
+        )
+        if not force_full_sync and signature == self._get_signature(project_id, "book_arcs"):
+            self._set_watermark(project_id, "book_arcs", book_arc.updated_at)
+            return 0
+
+        # One lookup for all beats; only what change detection needs
+        existing_beats = {
+            row.beat_type: row
+            for row in self.db.query(
+                TimelineEvent.id,
+                TimelineEvent.beat_type,
+                TimelineEvent.sync_hash
+            ).filter(
+                TimelineEvent.project_id == project_id,
+                TimelineEvent.event_type == TimelineEventType.BEAT
+            ).all()
+        }
 
-        for beat_name, beat_data, color in beats:
+        synced_count = 0
+        inserts = []
+        updates = []
+        for beat_name, color in _BEAT_SPECS:
+            beat_data = getattr(book_arc, beat_name)
             if not beat_data or not isinstance(beat_data, dict):
                 continue
 
@@ -341,161 +520,361 @@ class TimelineService:
             if not chapter:
                 continue
 
-            source_hash = self._calculate_hash({
-                "beat_type": beat_name,
-                "chapter": chapter,
-                "description": beat_data.get("description", ""),
-            })
+            source_hash = self._hash_fields(
+                beat_name,
+                chapter,
+                beat_data.get("description", ""),
+            )
+
+            existing = existing_beats.get(beat_name)
+            if existing and existing.sync_hash == source_hash:
+                continue  # Unchanged since the last sync
 
-            # Use beat_name as unique identifier (source_id will be derived)
-            existing = self.db.query(TimelineEvent).filter(
-                TimelineEvent.project_id == project_id,
-                TimelineEvent.event_type == TimelineEventType.BEAT,
-                TimelineEvent.metadata["beat"]["beat_type"].astext == beat_name
-            ).first()
+            event_metadata = {
+                "beat": {
+                    "beat_type": beat_name,
+                    "act": 1 if chapter <= (book_arc.act1_end_chapter or 7) else (
+                        2 if chapter <= (book_arc.act2_end_chapter or 20) else 3
+                    ),
+                    "changes": beat_data.get("changes", ""),
+                }
+            }
 
             if existing:
-                if existing.sync_hash != source_hash:
-                    existing.chapter_number = chapter
-                    existing.title = beat_name.replace("_", " ").title()
-                    existing.description = beat_data.get("description", "")
-                    existing.color = color
-                    existing.metadata = {
-                        "beat": {
-                            "beat_type": beat_name,
-                            "act": 1 if chapter <= (book_arc.act1_end_chapter or 7) else (
-                                2 if chapter <= (book_arc.act2_end_chapter or 20) else 3
-                            ),
-                            "changes": beat_data.get("changes", ""),
-                        }
-                    }
-                    existing.sync_hash = source_hash
-                    existing.last_synced_at = datetime.utcnow()
-                    synced_count += 1
+                updates.append({
+                    "id": existing.id,
+                    "chapter_number": chapter,
+                    "title": beat_name.replace("_", " ").title(),
+                    "description": beat_data.get("description", ""),
+                    "color": color,
+                    "event_metadata": event_metadata,
+                    "sync_hash": source_hash,
+                    "last_synced_at": now,
+                })
+                synced_count += 1
             else:
-                new_event = TimelineEvent(
-                    project_id=project_id,
-                    event_type=TimelineEventType.BEAT,
-                    source_id=book_arc.id,
-                    source_table="book_arcs",
-                    chapter_number=chapter,
-                    title=beat_name.replace("_", " ").title(),
-                    description=beat_data.get("description", ""),
-                    layer=TimelineLayer.PLOT,
-                    color=color,
-                    icon="star",
-                    magnitude=0.9,
-                    is_major_beat=True,
-                    metadata={
-                        "beat": {
-                            "beat_type": beat_name,
-                            "act": 1 if chapter <= (book_arc.act1_end_chapter or 7) else (
-                                2 if chapter <= (book_arc.act2_end_chapter or 20) else 3
-                            ),
-                            "changes": beat_data.get("changes", ""),
-                        }
-                    },
-                    sync_hash=source_hash,
-                    last_synced_at=datetime.utcnow(),
-                    is_custom=False
-                )
-                self.db.add(new_event)
+                inserts.append({
+                    "project_id": project_id,
+                    "event_type": TimelineEventType.BEAT,
+                    "source_id": book_arc.id,
+                    "source_table": "book_arcs",
+                    "beat_type": beat_name,
+                    "chapter_number": chapter,
+                    "title": beat_name.replace("_", " ").title(),
+                    "description": beat_data.get("description", ""),
+                    "layer": TimelineLayer.PLOT,
+                    "color": color,
+                    "icon": "star",
+                    "magnitude": 0.9,
+                    "is_major_beat": True,
+                    "event_metadata": event_metadata,
+                    "sync_hash": source_hash,
+                    "last_synced_at": now,
+                    "is_custom": False,
+                })
                 synced_count += 1
 
-        self.db.commit()
+        self._write_batch(inserts, updates)
+        self._set_watermark(project_id, "book_arcs", book_arc.updated_at, signature)
         return synced_count
 
-    def _sync_consequences(self, project_id: int) -> int:
+    def _sync_consequences(self, project_id: int, force_full_sync: bool = False) -> int:
         """Sync consequences to timeline events"""
-        consequences = self.db.query(Consequence).join(
-            StoryEvent
+        now = datetime.utcnow()
+        watermark = self._get_watermark(project_id, "consequences", force_full_sync)
+        # Only realized consequences with a placed target event are synced;
+        # the target's chapter comes along in the same row
+        target_event = aliased(StoryEvent)
+        query = self.db.query(
+            Consequence,
+            target_event.chapter_number.label("target_chapter"),
+            target_event.updated_at.label("target_updated_at")
+        ).join(
+            StoryEvent, Consequence.source_event_id == StoryEvent.id
+        ).join(
+            target_event, Consequence.target_event_id == target_event.id
         ).filter(
-            StoryEvent.project_id == project_id
-        ).all()
+            StoryEvent.project_id == project_id,
+            Consequence.status == ConsequenceStatus.REALIZED,
+            target_event.chapter_number.isnot(None)
+        )
+        if watermark is not None:
+            # The timeline position comes from the target event, so a moved
+            # target must re-sync the consequence too
+            query = query.filter(or_(
+                Consequence.updated_at > watermark,
+                target_event.updated_at > watermark
+            ))
 
         synced_count = 0
-        for consequence in consequences:
-            # Only sync realized consequences with target events
-            if consequence.status.value != "realized" or not consequence.target_event_id:
-                continue
-
-            # Get target event to find chapter
-            target_event = self.db.query(StoryEvent).filter(
-                StoryEvent.id == consequence.target_event_id
-            ).first()
-
-            if not target_event or not target_event.chapter_number:
-                continue
+        new_watermark = None
+        for rows in self._iter_batches(query):
+            new_watermark = max(
+                new_watermark or datetime.min,
+                *(max(c.updated_at, target_updated_at) for c, _, target_updated_at in rows)
+            )
 
-            source_hash = self._calculate_hash({
-                "description": consequence.description,
-                "target_chapter": target_event.chapter_number,
-                "status": consequence.status.value,
-            })
+            source_hashes = {
+                consequence.id: self._hash_fields(
+                    consequence.description,
+                    target_chapter,
+                    consequence.status.value,
+                )
+                for consequence, target_chapter, _ in rows
+            }
 
-            existing = self.db.query(TimelineEvent).filter(
-                TimelineEvent.project_id == project_id,
-                TimelineEvent.event_type == TimelineEventType.CONSEQUENCE,
-                TimelineEvent.source_id == consequence.id
-            ).first()
+            stale_ids, known_source_ids = self._load_stale_events(
+                project_id, TimelineEventType.CONSEQUENCE, source_hashes
+            )
 
-            if existing:
-                if existing.sync_hash != source_hash:
-                    existing.chapter_number = target_event.chapter_number
-                    existing.title = f"Consequence: {consequence.description[:50]}"
-                    existing.description = consequence.description
-                    existing.magnitude = consequence.severity
-                    existing.metadata = {
-                        "consequence": {
-                            "timeframe": consequence.timeframe.value,
-                            "status": consequence.status.value,
-                            "probability": consequence.probability,
-                            "severity": consequence.severity,
-                            "source_event_id": consequence.source_event_id,
-                        }
+            inserts = []
+            updates = []
+            for consequence, target_chapter, _ in rows:
+                source_hash = source_hashes[consequence.id]
+                event_id = stale_ids.get(consequence.id)
+                if event_id is None and consequence.id in known_source_ids:
+                    continue  # Unchanged since the last sync
+
+                event_metadata = {
+                    "consequence": {
+                        "timeframe": consequence.timeframe.value,
+                        "status": consequence.status.value,
+                        "probability": consequence.probability,
+                        "severity": consequence.severity,
+                        "source_event_id": consequence.source_event_id,
                     }
-                    existing.sync_hash = source_hash
-                    existing.last_synced_at = datetime.utcnow()
+                }
+
+                if event_id is not None:
+                    updates.append({
+                        "id": event_id,
+                        "chapter_number": target_chapter,
+                        "title": f"Consequence: {consequence.description[:50]}",
+                        "description": consequence.description,
+                        "magnitude": consequence.severity,
+                        "event_metadata": event_metadata,
+                        "sync_hash": source_hash,
+                        "last_synced_at": now,
+                    })
+                    synced_count += 1
+                else:
+                    inserts.append({
+                        "project_id": project_id,
+                        "event_type": TimelineEventType.CONSEQUENCE,
+                        "source_id": consequence.id,
+                        "source_table": "consequences",
+                        "chapter_number": target_chapter,
+                        "title": f"Consequence: {consequence.description[:50]}",
+                        "description": consequence.description,
+                        "layer": TimelineLayer.CONSEQUENCE,
+                        "color": "#F59E0B",
+                        "icon": "git-branch",
+                        "magnitude": consequence.severity,
+                        "event_metadata": event_metadata,
+                        "sync_hash": source_hash,
+                        "last_synced_at": now,
+                        "is_custom": False,
+                    })
                     synced_count += 1
-            else:
-                new_event = TimelineEvent(
-                    project_id=project_id,
-                    event_type=TimelineEventType.CONSEQUENCE,
-                    source_id=consequence.id,
-                    source_table="consequences",
-                    chapter_number=target_event.chapter_number,
-                    title=f"Consequence: {consequence.description[:50]}",
-                    description=consequence.description,
-                    layer=TimelineLayer.CONSEQUENCE,
-                    color="#F59E0B",
-                    icon="git-branch",
-                    magnitude=consequence.severity,
-                    metadata={
-                        "consequence": {
-                            "timeframe": consequence.timeframe.value,
-                            "status": consequence.status.value,
-                            "probability": consequence.probability,
-                            "severity": consequence.severity,
-                            "source_event_id": consequence.source_event_id,
-                        }
-                    },
-                    sync_hash=source_hash,
-                    last_synced_at=datetime.utcnow(),
-                    is_custom=False
-                )
-                self.db.add(new_event)
-                synced_count += 1
 
-        self.db.commit()
+            self._write_batch(inserts, updates)
+
+        self._set_watermark(project_id, "consequences", new_watermark)
         return synced_count
 
     # ==================== Helper Methods ====================
 
-    def _calculate_hash(self, data: Dict[str, Any]) -> str:
-        """Calculate hash of data for change detection"""
-        # Convert to JSON string with sorted keys for consistency
-        json_str = json.dumps(data, sort_keys=True, default=str)
-        return hashlib.sha256(json_str.encode()).hexdigest()
+    def _get_watermark(
+        self,
+        project_id: int,
+        source_table: str,
+        force_full_sync: bool = False
+    ) -> Optional[datetime]:
+        """
+        Get the updated_at to sync a source table from (None = full scan)
+
+        That is the last synced updated_at minus _WATERMARK_LAG, so rows
+        committed late with an earlier timestamp are still picked up.
+        """
+        if force_full_sync:
+            return None
+
+        watermark = self.db.query(TimelineSyncState.watermark).filter(
+            TimelineSyncState.project_id == project_id,
+            TimelineSyncState.source_table == source_table
+        ).scalar()
+        if watermark is None:
+            return None
+        return watermark - _WATERMARK_LAG
+
+    def _get_signature(self, project_id: int, source_table: str) -> Optional[str]:
+        """Get the source signature stored by the last sync of a source table"""
+        return self.db.query(TimelineSyncState.signature).filter(
+            TimelineSyncState.project_id == project_id,
+            TimelineSyncState.source_table == source_table
+        ).scalar()
+
+    def _set_watermark(
+        self,
+        project_id: int,
+        source_table: str,
+        watermark: Optional[datetime],
+        signature: Optional[str] = None
+    ) -> None:
+        """Advance the sync watermark (and optionally signature) for a source table"""
+        if watermark is None:
+            return
+
+        state = self.db.query(TimelineSyncState).filter(
+            TimelineSyncState.project_id == project_id,
+            TimelineSyncState.source_table == source_table
+        ).first()
+
+        if not state:
+            self.db.add(TimelineSyncState(
+                project_id=project_id,
+                source_table=source_table,
+                watermark=watermark,
+                signature=signature
+            ))
+            return
+
+        if state.watermark is None or watermark > state.watermark:
+            state.watermark = watermark
+        if signature is not None:
+            state.signature = signature
+
+    def _write_batch(self, inserts: List[Dict[str, Any]], updates: List[Dict[str, Any]]) -> None:
+        """
+        Write one batch of synced events
+
+        New rows go out as a single INSERT ... RETURNING, so the chapters
+        they landed in (like those of updated rows) are known without a
+        re-query and conflict detection can be scoped to them.
+        """
+        if updates:
+            self.db.bulk_update_mappings(TimelineEvent, updates)
+            self.synced_chapters.update(u["chapter_number"] for u in updates)
+        if inserts and len(inserts) >= _COPY_THRESHOLD and self.db.get_bind().dialect.driver == "psycopg2":
+            self._bulk_copy_events(inserts)
+            self.synced_chapters.update(row["chapter_number"] for row in inserts)
+        elif inserts:
+            rows = self.db.execute(
+                insert(TimelineEvent).returning(TimelineEvent.chapter_number),
+                inserts
+            )
+            self.synced_chapters.update(row.chapter_number for row in rows)
+        # Write the batch out so its objects can be released
+        self.db.flush()
+
+    def _bulk_copy_events(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Write new events with COPY ... FROM STDIN
+
+        Used for big batches (typically a project's first sync), where COPY
+        beats even a multi-row INSERT. COPY skips the ORM, so column defaults
+        are filled in here and JSON / enum values are serialized the way the
+        ORM column types would store them. Runs on the session's connection,
+        inside its transaction.
+        """
+        columns = [c for c in TimelineEvent.__table__.columns if c.name != "id"]
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for row in rows:
+            values = []
+            for column in columns:
+                if column.name in row:
+                    value = row[column.name]
+                elif column.default is not None:
+                    default = column.default
+                    value = default.arg(None) if default.is_callable else default.arg
+                else:
+                    value = None
+
+                if value is None:
+                    value = r"\N"
+                elif isinstance(value, enum.Enum):
+                    value = value.name  # SQLAlchemy Enum columns store member names
+                elif isinstance(value, (dict, list)):
+                    value = json.dumps(value)
+                elif isinstance(value, datetime):
+                    value = value.isoformat()
+                values.append(value)
+            writer.writerow(values)
+        buf.seek(0)
+
+        column_list = ", ".join(c.name for c in columns)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY timeline_events ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buf
+            )
+        finally:
+            cursor.close()
+
+    def _iter_batches(self, query) -> Iterator[list]:
+        """
+        Stream query results in lists of up to _SYNC_BATCH_SIZE rows
+
+        Uses yield_per so huge projects never hold every source row at once.
+        """
+        rows = iter(query.yield_per(_SYNC_BATCH_SIZE))
+        while True:
+            batch = list(islice(rows, _SYNC_BATCH_SIZE))
+            if not batch:
+                return
+            yield batch
+
+    def _load_stale_events(
+        self,
+        project_id: int,
+        event_type: TimelineEventType,
+        source_hashes: Dict[int, str]
+    ) -> Tuple[Dict[int, int], Set[int]]:
+        """
+        Find synced events whose stored hash differs from the source hash
+
+        Only (id, source_id, is_stale) is selected and the hash comparison
+        runs in SQL, so event payloads (event_metadata etc.) never leave the
+        database. Returns stale event ids keyed by source_id, plus the set
+        of source_ids that already have an event (anything else is new).
+        """
+        if not source_hashes:
+            return {}, set()
+
+        expected_hash = case(source_hashes, value=TimelineEvent.source_id)
+        rows = self.db.query(
+            TimelineEvent.id,
+            TimelineEvent.source_id,
+            or_(
+                TimelineEvent.sync_hash.is_(None),
+                TimelineEvent.sync_hash != expected_hash
+            ).label("is_stale")
+        ).filter(
+            TimelineEvent.project_id == project_id,
+            TimelineEvent.event_type == event_type,
+            TimelineEvent.source_id.in_(list(source_hashes))
+        ).all()
+
+        stale_ids = {row.source_id: row.id for row in rows if row.is_stale}
+        return stale_ids, {row.source_id for row in rows}
+
+    def _hash_fields(self, *vals: Any) -> str:
+        """
+        Calculate hash of source fields for change detection
+
+        Fields are fed positionally, so callers must always pass them
+        in the same order. Skips building a dict + JSON string per row.
+        Only used for equality, so a short BLAKE2b digest is plenty (and
+        cheaper than SHA-256).
+
+        The repr of the whole tuple is already canonical and unambiguous
+        (strings come quoted, so ("ab", "c") != ("a", "bc")), so it is
+        hashed in a single update instead of field by field.
+        """
+        return hashlib.blake2b(repr(vals).encode(), digest_size=8).hexdigest()
 
     # ==================== CRUD Operations ====================
 
@@ -509,6 +888,7 @@ class TimelineService:
         tags: Optional[List[str]] = None,
         only_visible: bool = True,
         only_major_beats: bool = False,
+        match_all_tags: bool = True,
     ) -> List[TimelineEvent]:
         """
         Get timeline events with filtering
@@ -522,6 +902,10 @@ class TimelineService:
             tags: Filter by tags
             only_visible: Only return visible events
             only_major_beats: Only return major story beats
+            match_all_tags: Require every tag (default) instead of any tag
+
+        The is_visible / is_major_beat filters are served by the partial
+        indexes idx_tle_visible_chapter and idx_tle_major_beat.
 
         Returns:
             List of TimelineEvent objects
@@ -548,10 +932,11 @@ class TimelineService:
         if only_major_beats:
             query = query.filter(TimelineEvent.is_major_beat == True)
 
-        # Tag filtering (JSONB contains)
+        # Tag filtering: a single jsonb ?& (all-of) / ?| (any-of) predicate
+        # served by the idx_tle_tags GIN index
         if tags:
-            for tag in tags:
-                query = query.filter(TimelineEvent.tags.contains([tag]))
+            tag_op = "?&" if match_all_tags else "?|"
+            query = query.filter(TimelineEvent.tags.op(tag_op)(array(tags, type_=Text)))
 
         # Order by chapter, then position weight
         query = query.order_by(
@@ -651,187 +1036,324 @@ class TimelineService:
 
     # ==================== Conflict Detection ====================
 
-    def detect_all_conflicts(self, project_id: int) -> Dict[str, int]:
+    def detect_all_conflicts(
+        self,
+        project_id: int,
+        chapters: Optional[Set[int]] = None
+    ) -> Dict[str, int]:
         """
         Run all conflict detection algorithms
 
+        chapters limits the per-chapter detectors (overlap, character) to
+        those chapter numbers; None scans the whole project.
+
         Returns counts of conflicts detected by type
         """
-        counts = {
-            "overlap": self._detect_overlap_conflicts(project_id),
-            "character_conflicts": self._detect_character_conflicts(project_id),
-            "pacing_issues": self._detect_pacing_issues(project_id),
-            "continuity_errors": self._detect_continuity_errors(project_id),
-        }
+        try:
+            # A full run over exactly the events, arcs and conflicts the last
+            # full run finished with cannot find anything new
+            if chapters is None and self._detection_signature(project_id) == self._get_signature(project_id, "detection"):
+                counts = {
+                    "overlap": 0,
+                    "character_conflicts": 0,
+                    "pacing_issues": 0,
+                    "continuity_errors": 0,
+                }
+            else:
+                # Character and pacing detection read the same visible events
+                events = self._load_detection_events(project_id, chapters)
+                counts = {
+                    "overlap": self._detect_overlap_conflicts(project_id, chapters),
+                    "character_conflicts": self._detect_character_conflicts(project_id, chapters, events),
+                    "pacing_issues": self._detect_pacing_issues(project_id, events),
+                    "continuity_errors": self._detect_continuity_errors(project_id),
+                }
+
+                # Only a full run may vouch for the whole project
+                if chapters is None:
+                    self._set_watermark(
+                        project_id,
+                        "detection",
+                        datetime.utcnow(),
+                        self._detection_signature(project_id)
+                    )
+        except Exception:
+            self.db.rollback()
+            raise
+
+        # One commit for all detectors (and any pending sync writes)
+        self.db.commit()
         return counts
 
-    def _detect_overlap_conflicts(self, project_id: int) -> int:
+    def _detection_signature(self, project_id: int) -> str:
+        """
+        Fingerprint everything the detectors read, in three aggregate queries
+
+        Counts catch deletes, max ids catch inserts and max updated_at
+        catches edits to timeline events, character arcs and conflicts.
+        Per-status conflict counts catch a resolve or ignore, after which
+        a conflict that still exists has to be reported again.
+        """
+        events = self.db.query(
+            func.count(TimelineEvent.id),
+            func.max(TimelineEvent.id),
+            func.max(TimelineEvent.updated_at)
+        ).filter(
+            TimelineEvent.project_id == project_id
+        ).one()
+        arcs = self.db.query(
+            func.count(CharacterArc.id),
+            func.max(CharacterArc.updated_at)
+        ).filter(
+            CharacterArc.project_id == project_id
+        ).one()
+        conflicts = self.db.query(
+            func.count(TimelineConflict.id),
+            func.max(TimelineConflict.id),
+            func.max(TimelineConflict.updated_at),
+            *(
+                func.sum(case((TimelineConflict.status == status, 1), else_=0))
+                for status in _CONFLICT_STATUSES
+            )
+        ).filter(
+            TimelineConflict.project_id == project_id
+        ).one()
+        return self._hash_fields(*events, *arcs, *conflicts)
+
+    def _load_detection_events(self, project_id: int, chapters: Optional[Set[int]] = None) -> list:
+        """
+        Fetch visible events once for the character and pacing detectors
+
+        Selects the union of the columns both need. When scoped to chapters,
+        that is the events in those chapters (character) plus every major
+        beat (pacing always looks at the whole project). Ordered by chapter.
+        """
+        query = self.db.query(
+            TimelineEvent.id,
+            TimelineEvent.chapter_number,
+            TimelineEvent.related_characters,
+            TimelineEvent.is_major_beat
+        ).filter(
+            TimelineEvent.project_id == project_id,
+            TimelineEvent.is_visible == True
+        )
+        if chapters is not None:
+            query = query.filter(or_(
+                TimelineEvent.is_major_beat == True,
+                TimelineEvent.chapter_number.in_(list(chapters))
+            ))
+        return query.order_by(TimelineEvent.chapter_number).all()
+
+    def _detect_overlap_conflicts(self, project_id: int, chapters: Optional[Set[int]] = None) -> int:
         """
         Detect events that overlap in the same chapter
 
         Creates warnings when multiple high-magnitude events
         occur in the same chapter.
         """
-        # Get all events grouped by chapter
-        events = self.db.query(TimelineEvent).filter(
+        is_milestone = TimelineEvent.event_type == TimelineEventType.MILESTONE
+        visible = and_(
             TimelineEvent.project_id == project_id,
             TimelineEvent.is_visible == True
+        )
+        if chapters is not None:
+            visible = and_(visible, TimelineEvent.chapter_number.in_(list(chapters)))
+
+        # Count per chapter in SQL; only chapters over a threshold come back
+        major_count = func.sum(case((TimelineEvent.is_major_beat == True, 1), else_=0))
+        milestone_count = func.sum(case((is_milestone, 1), else_=0))
+        flagged_chapters = [
+            row.chapter_number
+            for row in self.db.query(TimelineEvent.chapter_number).filter(
+                visible
+            ).group_by(
+                TimelineEvent.chapter_number
+            ).having(
+                or_(major_count > 2, milestone_count > 3)
+            ).all()
+        ]
+        if not flagged_chapters:
+            return 0
+
+        # Existing overlap conflicts, loaded once instead of checked per chapter
+        existing_conflicts = self.db.query(
+            TimelineConflict.chapter_start,
+            TimelineConflict.description,
+            TimelineConflict.status
+        ).filter(
+            TimelineConflict.project_id == project_id,
+            TimelineConflict.conflict_type == ConflictType.OVERLAP
+        ).all()
+        open_overlap_chapters = {
+            c.chapter_start for c in existing_conflicts if c.status == "open"
+        }
+        milestone_overlap_chapters = {
+            c.chapter_start for c in existing_conflicts if "milestones" in (c.description or "")
+        }
+
+        # Major beat / milestone ids of the flagged chapters, streamed in
+        # chapter order; ids are kept only for chapters that get a new conflict
+        events = self.db.query(
+            TimelineEvent.id,
+            TimelineEvent.chapter_number,
+            TimelineEvent.is_major_beat,
+            is_milestone.label("is_milestone")
+        ).filter(
+            visible,
+            TimelineEvent.chapter_number.in_(flagged_chapters),
+            or_(TimelineEvent.is_major_beat == True, is_milestone)
         ).order_by(
             TimelineEvent.chapter_number,
             TimelineEvent.position_weight
-        ).all()
-
-        # Group by chapter
-        chapters: Dict[int, List[TimelineEvent]] = {}
-        for event in events:
-            if event.chapter_number not in chapters:
-                chapters[event.chapter_number] = []
-            chapters[event.chapter_number].append(event)
+        ).yield_per(_SYNC_BATCH_SIZE)
 
         conflicts_created = 0
+        new_conflicts = []
 
-        for chapter_num, chapter_events in chapters.items():
-            # Count major beats in this chapter
-            major_beats = [e for e in chapter_events if e.is_major_beat]
+        for chapter_num, chapter_events in groupby(events, key=attrgetter("chapter_number")):
+            major_beats = []
+            milestones = []
+            for event in chapter_events:
+                if event.is_major_beat:
+                    major_beats.append(event.id)
+                if event.is_milestone:
+                    milestones.append(event.id)
 
             if len(major_beats) > 2:
                 # Too many major beats in one chapter
-                event_ids = [e.id for e in major_beats]
-
-                # Check if conflict already exists
-                existing = self.db.query(TimelineConflict).filter(
-                    TimelineConflict.project_id == project_id,
-                    TimelineConflict.conflict_type == ConflictType.OVERLAP,
-                    TimelineConflict.chapter_start == chapter_num,
-                    TimelineConflict.status == "open"
-                ).first()
-
-                if not existing:
-                    conflict = TimelineConflict(
-                        project_id=project_id,
-                        conflict_type=ConflictType.OVERLAP,
-                        severity=ConflictSeverity.WARNING,
-                        chapter_start=chapter_num,
-                        chapter_end=chapter_num,
-                        event_ids=event_ids,
-                        title=f"Chapter {chapter_num}: Too Many Major Events",
-                        description=f"Chapter {chapter_num} contains {len(major_beats)} major story beats. "
+                event_ids = major_beats
+
+                if chapter_num not in open_overlap_chapters:
+                    new_conflicts.append({
+                        "project_id": project_id,
+                        "conflict_type": ConflictType.OVERLAP,
+                        "severity": ConflictSeverity.WARNING,
+                        "chapter_start": chapter_num,
+                        "chapter_end": chapter_num,
+                        "event_ids": event_ids,
+                        "title": f"Chapter {chapter_num}: Too Many Major Events",
+                        "description": f"Chapter {chapter_num} contains {len(major_beats)} major story beats. "
                                   f"This may overwhelm the reader. Consider spreading events across chapters.",
-                        suggestions=[
+                        "suggestions": [
                             {
                                 "action": "move_event",
                                 "details": "Move one or more events to adjacent chapters for better pacing"
                             }
                         ],
-                        detection_method="overlap_detector",
-                        confidence=0.8
-                    )
-                    self.db.add(conflict)
+                        "detection_method": "overlap_detector",
+                        "confidence": 0.8,
+                    })
                     conflicts_created += 1
 
             # Check for milestone clustering
-            milestones = [e for e in chapter_events if e.event_type == TimelineEventType.MILESTONE]
             if len(milestones) > 3:
-                event_ids = [e.id for e in milestones]
-
-                existing = self.db.query(TimelineConflict).filter(
-                    TimelineConflict.project_id == project_id,
-                    TimelineConflict.conflict_type == ConflictType.OVERLAP,
-                    TimelineConflict.chapter_start == chapter_num,
-                    TimelineConflict.description.contains("milestones")
-                ).first()
-
-                if not existing:
-                    conflict = TimelineConflict(
-                        project_id=project_id,
-                        conflict_type=ConflictType.OVERLAP,
-                        severity=ConflictSeverity.INFO,
-                        chapter_start=chapter_num,
-                        chapter_end=chapter_num,
-                        event_ids=event_ids,
-                        title=f"Chapter {chapter_num}: Multiple Character Milestones",
-                        description=f"{len(milestones)} character arc milestones occur in this chapter. "
+                event_ids = milestones
+
+                if chapter_num not in milestone_overlap_chapters:
+                    new_conflicts.append({
+                        "project_id": project_id,
+                        "conflict_type": ConflictType.OVERLAP,
+                        "severity": ConflictSeverity.INFO,
+                        "chapter_start": chapter_num,
+                        "chapter_end": chapter_num,
+                        "event_ids": event_ids,
+                        "title": f"Chapter {chapter_num}: Multiple Character Milestones",
+                        "description": f"{len(milestones)} character arc milestones occur in this chapter. "
                                   f"This is acceptable but verify it's intentional.",
-                        detection_method="overlap_detector",
-                        confidence=0.6
-                    )
-                    self.db.add(conflict)
+                        "detection_method": "overlap_detector",
+                        "confidence": 0.6,
+                    })
                     conflicts_created += 1
 
-        self.db.commit()
+        if new_conflicts:
+            # One multi-row INSERT instead of a unit-of-work flush per conflict
+            self.db.execute(insert(TimelineConflict), new_conflicts)
         return conflicts_created
 
-    def _detect_character_conflicts(self, project_id: int) -> int:
+    def _detect_character_conflicts(
+        self,
+        project_id: int,
+        chapters: Optional[Set[int]] = None,
+        events: Optional[list] = None
+    ) -> int:
         """
         Detect characters appearing in conflicting locations/events
 
         Checks if a character has milestones or events that would
         require them to be in multiple places simultaneously.
         """
-        events = self.db.query(TimelineEvent).filter(
-            TimelineEvent.project_id == project_id,
-            TimelineEvent.is_visible == True
-        ).all()
+        if events is None:
+            events = self._load_detection_events(project_id, chapters)
+        if chapters is not None:
+            events = [e for e in events if e.chapter_number in chapters]
+
+        # Count appearances first so only over-threshold keys get id lists
+        counts: Counter = Counter(
+            (event.chapter_number, char_id)
+            for event in events
+            for char_id in (event.related_characters or ())
+        )
+        hot = {key for key, count in counts.items() if count > 5}
+        if not hot:
+            return 0
 
-        # Group events by chapter and character
-        character_chapters: Dict[int, Dict[int, List[TimelineEvent]]] = {}
+        # Event ids grouped by (chapter, character), hot keys only
+        buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
 
         for event in events:
-            if not event.related_characters:
-                continue
-
-            chapter = event.chapter_number
-            if chapter not in character_chapters:
-                character_chapters[chapter] = {}
-
-            for char_id in event.related_characters:
-                if char_id not in character_chapters[chapter]:
-                    character_chapters[chapter][char_id] = []
-                character_chapters[chapter][char_id].append(event)
+            for char_id in (event.related_characters or ()):
+                key = (event.chapter_number, char_id)
+                if key in hot:
+                    buckets[key].append(event.id)
+
+        # Existing character conflicts as (chapter, event id) pairs, loaded once
+        existing_pairs = {
+            (row.chapter_start, event_id)
+            for row in self.db.query(
+                TimelineConflict.chapter_start,
+                TimelineConflict.event_ids
+            ).filter(
+                TimelineConflict.project_id == project_id,
+                TimelineConflict.conflict_type == ConflictType.CHARACTER_CONFLICT
+            ).all()
+            for event_id in (row.event_ids or [])
+        }
 
         conflicts_created = 0
-
-        # Check for characters with too many concurrent events
-        for chapter_num, characters in character_chapters.items():
-            for char_id, char_events in characters.items():
-                if len(char_events) > 5:
-                    # Character is involved in many events this chapter
-                    event_ids = [e.id for e in char_events]
-
-                    existing = self.db.query(TimelineConflict).filter(
-                        TimelineConflict.project_id == project_id,
-                        TimelineConflict.conflict_type == ConflictType.CHARACTER_CONFLICT,
-                        TimelineConflict.chapter_start == chapter_num,
-                        TimelineConflict.event_ids.contains(event_ids[:1])  # Check if any event matches
-                    ).first()
-
-                    if not existing:
-                        conflict = TimelineConflict(
-                            project_id=project_id,
-                            conflict_type=ConflictType.CHARACTER_CONFLICT,
-                            severity=ConflictSeverity.WARNING,
-                            chapter_start=chapter_num,
-                            chapter_end=chapter_num,
-                            event_ids=event_ids,
-                            title=f"Chapter {chapter_num}: Character Over-Involved",
-                            description=f"Character (ID: {char_id}) is involved in {len(char_events)} events in this chapter. "
-                                      f"Verify this character can realistically participate in all these events.",
-                            suggestions=[
-                                {
-                                    "action": "review_events",
-                                    "details": "Review event timing and character availability"
-                                }
-                            ],
-                            detection_method="character_conflict_detector",
-                            confidence=0.7
-                        )
-                        self.db.add(conflict)
-                        conflicts_created += 1
-
-        self.db.commit()
+        new_conflicts = []
+
+        # Every bucket is a character with too many concurrent events
+        for (chapter_num, char_id), event_ids in buckets.items():
+            # Character is involved in many events this chapter; skip if a
+            # conflict in this chapter already covers the first event
+            if (chapter_num, event_ids[0]) not in existing_pairs:
+                new_conflicts.append({
+                    "project_id": project_id,
+                    "conflict_type": ConflictType.CHARACTER_CONFLICT,
+                    "severity": ConflictSeverity.WARNING,
+                    "chapter_start": chapter_num,
+                    "chapter_end": chapter_num,
+                    "event_ids": event_ids,
+                    "title": f"Chapter {chapter_num}: Character Over-Involved",
+                    "description": f"Character (ID: {char_id}) is involved in {len(event_ids)} events in this chapter. "
+                              f"Verify this character can realistically participate in all these events.",
+                    "suggestions": [
+                        {
+                            "action": "review_events",
+                            "details": "Review event timing and character availability"
+                        }
+                    ],
+                    "detection_method": "character_conflict_detector",
+                    "confidence": 0.7,
+                })
+                existing_pairs.update((chapter_num, event_id) for event_id in event_ids)
+                conflicts_created += 1
+
+        if new_conflicts:
+            self.db.execute(insert(TimelineConflict), new_conflicts)
         return conflicts_created
 
-    def _detect_pacing_issues(self, project_id: int) -> int:
+    def _detect_pacing_issues(self, project_id: int, events: Optional[list] = None) -> int:
         """
         Detect pacing problems in the timeline
 
@@ -840,57 +1362,66 @@ class TimelineService:
         - Too many events clustered together
         - Uneven distribution of story beats
         """
-        events = self.db.query(TimelineEvent).filter(
-            TimelineEvent.project_id == project_id,
-            TimelineEvent.is_visible == True,
-            TimelineEvent.is_major_beat == True
-        ).order_by(TimelineEvent.chapter_number).all()
+        if events is None:
+            events = self._load_detection_events(project_id)
+        events = [e for e in events if e.is_major_beat]
 
         if len(events) < 2:
             return 0
 
+        # Positions i where the gap from events[i] to events[i + 1] is too large
+        chapter_numbers = np.fromiter((e.chapter_number for e in events), dtype=np.int64, count=len(events))
+        large_gaps = np.flatnonzero(np.diff(chapter_numbers) > 7)
+        if large_gaps.size == 0:
+            return 0
+
+        # Existing pacing conflicts by (start, end) chapter, loaded once
+        existing_gaps = {
+            (row.chapter_start, row.chapter_end)
+            for row in self.db.query(
+                TimelineConflict.chapter_start,
+                TimelineConflict.chapter_end
+            ).filter(
+                TimelineConflict.project_id == project_id,
+                TimelineConflict.conflict_type == ConflictType.PACING_ISSUE
+            ).all()
+        }
+
         conflicts_created = 0
+        new_conflicts = []
 
-        # Check gaps between major events
-        for i in range(len(events) - 1):
+        # Large gaps without major beats
+        for i in large_gaps.tolist():
             current = events[i]
             next_event = events[i + 1]
-
             gap = next_event.chapter_number - current.chapter_number
 
-            # Large gap without major beats
-            if gap > 7:
-                existing = self.db.query(TimelineConflict).filter(
-                    TimelineConflict.project_id == project_id,
-                    TimelineConflict.conflict_type == ConflictType.PACING_ISSUE,
-                    TimelineConflict.chapter_start == current.chapter_number,
-                    TimelineConflict.chapter_end == next_event.chapter_number
-                ).first()
-
-                if not existing:
-                    conflict = TimelineConflict(
-                        project_id=project_id,
-                        conflict_type=ConflictType.PACING_ISSUE,
-                        severity=ConflictSeverity.WARNING,
-                        chapter_start=current.chapter_number,
-                        chapter_end=next_event.chapter_number,
-                        event_ids=[current.id, next_event.id],
-                        title=f"Pacing Gap: Chapters {current.chapter_number}-{next_event.chapter_number}",
-                        description=f"There's a {gap}-chapter gap between major story beats. "
-                                  f"Consider adding tension or conflict to maintain reader engagement.",
-                        suggestions=[
-                            {
-                                "action": "add_event",
-                                "details": "Add a plot complication, character development, or rising tension"
-                            }
-                        ],
-                        detection_method="pacing_detector",
-                        confidence=0.7
-                    )
-                    self.db.add(conflict)
-                    conflicts_created += 1
-
-        self.db.commit()
+            gap_key = (current.chapter_number, next_event.chapter_number)
+            if gap_key not in existing_gaps:
+                new_conflicts.append({
+                    "project_id": project_id,
+                    "conflict_type": ConflictType.PACING_ISSUE,
+                    "severity": ConflictSeverity.WARNING,
+                    "chapter_start": current.chapter_number,
+                    "chapter_end": next_event.chapter_number,
+                    "event_ids": [current.id, next_event.id],
+                    "title": f"Pacing Gap: Chapters {current.chapter_number}-{next_event.chapter_number}",
+                    "description": f"There's a {gap}-chapter gap between major story beats. "
+                              f"Consider adding tension or conflict to maintain reader engagement.",
+                    "suggestions": [
+                        {
+                            "action": "add_event",
+                            "details": "Add a plot complication, character development, or rising tension"
+                        }
+                    ],
+                    "detection_method": "pacing_detector",
+                    "confidence": 0.7,
+                })
+                existing_gaps.add(gap_key)
+                conflicts_created += 1
+
+        if new_conflicts:
+            self.db.execute(insert(TimelineConflict), new_conflicts)
         return conflicts_created
 
     def _detect_continuity_errors(self, project_id: int) -> int:
@@ -903,9 +1434,25 @@ class TimelineService:
         - Events that reference future events
         """
         conflicts_created = 0
+        new_conflicts = []
+
+        # Arcs that already have a continuity conflict, loaded once
+        flagged_arc_ids = {
+            row.arc_id
+            for row in self.db.query(TimelineConflict.arc_id).filter(
+                TimelineConflict.project_id == project_id,
+                TimelineConflict.conflict_type == ConflictType.CONTINUITY_ERROR,
+                TimelineConflict.detection_method == "continuity_detector",
+                TimelineConflict.arc_id.isnot(None)
+            ).all()
+        }
 
         # Check character arcs
-        arcs = self.db.query(CharacterArc).filter(
+        arcs = self.db.query(
+            CharacterArc.id,
+            CharacterArc.start_chapter,
+            CharacterArc.end_chapter
+        ).filter(
             CharacterArc.project_id == project_id
         ).all()
 
@@ -913,85 +1460,113 @@ class TimelineService:
             if arc.start_chapter and arc.end_chapter:
                 if arc.end_chapter < arc.start_chapter:
                     # Arc ends before it begins
-                    existing = self.db.query(TimelineConflict).filter(
-                        TimelineConflict.project_id == project_id,
-                        TimelineConflict.conflict_type == ConflictType.CONTINUITY_ERROR,
-                        TimelineConflict.description.contains(f"Arc ID: {arc.id}")
-                    ).first()
-
-                    if not existing:
-                        conflict = TimelineConflict(
-                            project_id=project_id,
-                            conflict_type=ConflictType.CONTINUITY_ERROR,
-                            severity=ConflictSeverity.ERROR,
-                            chapter_start=arc.start_chapter,
-                            chapter_end=arc.end_chapter,
-                            event_ids=[],
-                            title=f"Character Arc Timeline Error",
-                            description=f"Character arc (Arc ID: {arc.id}) ends at chapter {arc.end_chapter} "
+                    if arc.id not in flagged_arc_ids:
+                        new_conflicts.append({
+                            "project_id": project_id,
+                            "conflict_type": ConflictType.CONTINUITY_ERROR,
+                            "severity": ConflictSeverity.ERROR,
+                            "chapter_start": arc.start_chapter,
+                            "chapter_end": arc.end_chapter,
+                            "event_ids": [],
+                            "arc_id": arc.id,
+                            "title": f"Character Arc Timeline Error",
+                            "description": f"Character arc (Arc ID: {arc.id}) ends at chapter {arc.end_chapter} "
                                       f"but starts at chapter {arc.start_chapter}. End must come after start.",
-                            suggestions=[
+                            "suggestions": [
                                 {
                                     "action": "edit_event",
                                     "details": "Correct the start or end chapter for this arc"
                                 }
                             ],
-                            detection_method="continuity_detector",
-                            confidence=1.0
-                        )
-                        self.db.add(conflict)
+                            "detection_method": "continuity_detector",
+                            "confidence": 1.0,
+                        })
                         conflicts_created += 1
 
-        # Check consequences and their sources
-        consequences = self.db.query(TimelineEvent).filter(
+        if new_conflicts:
+            self.db.execute(insert(TimelineConflict), new_conflicts)
+            new_conflicts = []
+
+        # Event ids already covered by a continuity conflict, loaded once
+        flagged_event_ids = {
+            event_id
+            for row in self.db.query(TimelineConflict.event_ids).filter(
+                TimelineConflict.project_id == project_id,
+                TimelineConflict.conflict_type == ConflictType.CONTINUITY_ERROR
+            ).all()
+            for event_id in (row.event_ids or [])
+        }
+
+        # Check consequences and their sources; the source id is extracted in
+        # SQL so event_metadata is never shipped or parsed here
+        source_event_id = TimelineEvent.event_metadata[
+            ("consequence", "source_event_id")
+        ].as_integer()
+        consequences_query = self.db.query(
+            TimelineEvent.id,
+            TimelineEvent.chapter_number,
+            source_event_id.label("source_event_id")
+        ).filter(
             TimelineEvent.project_id == project_id,
-            TimelineEvent.event_type == TimelineEventType.CONSEQUENCE
-        ).all()
+            TimelineEvent.event_type == TimelineEventType.CONSEQUENCE,
+            source_event_id.isnot(None)
+        )
 
-        for consequence in consequences:
-            source_event_id = consequence.metadata.get("consequence", {}).get("source_event_id")
-            if source_event_id:
-                # Find source event in timeline
-                source = self.db.query(TimelineEvent).filter(
-                    TimelineEvent.project_id == project_id,
-                    TimelineEvent.source_id == source_event_id,
-                    TimelineEvent.event_type == TimelineEventType.STORY_EVENT
-                ).first()
-
-                if source and source.chapter_number > consequence.chapter_number:
-                    # Consequence occurs before its cause
-                    existing = self.db.query(TimelineConflict).filter(
-                        TimelineConflict.project_id == project_id,
-                        TimelineConflict.conflict_type == ConflictType.CONTINUITY_ERROR,
-                        TimelineConflict.event_ids.contains([consequence.id])
-                    ).first()
-
-                    if not existing:
-                        conflict = TimelineConflict(
-                            project_id=project_id,
-                            conflict_type=ConflictType.CONTINUITY_ERROR,
-                            severity=ConflictSeverity.CRITICAL,
-                            chapter_start=consequence.chapter_number,
-                            chapter_end=source.chapter_number,
-                            event_ids=[consequence.id, source.id],
-                            title=f"Consequence Before Cause",
-                            description=f"A consequence occurs in chapter {consequence.chapter_number} "
-                                      f"but its source event is in chapter {source.chapter_number}. "
-                                      f"Effects cannot precede their causes.",
-                            suggestions=[
-                                {
-                                    "action": "move_event",
-                                    "event_id": consequence.id,
-                                    "details": f"Move consequence to chapter {source.chapter_number + 1} or later"
-                                }
-                            ],
-                            detection_method="continuity_detector",
-                            confidence=1.0
-                        )
-                        self.db.add(conflict)
-                        conflicts_created += 1
+        # Streamed in windows: each batch resolves its own sources and writes
+        # its own conflicts, so nothing grows with the project size
+        for consequences in self._iter_batches(consequences_query):
+            # Source story events in timeline, resolved in one IN query
+            wanted_sources = {c.source_event_id for c in consequences if c.source_event_id}
+            sources = {}
+            if wanted_sources:
+                sources = {
+                    row.source_id: row
+                    for row in self.db.query(
+                        TimelineEvent.id,
+                        TimelineEvent.source_id,
+                        TimelineEvent.chapter_number
+                    ).filter(
+                        TimelineEvent.project_id == project_id,
+                        TimelineEvent.event_type == TimelineEventType.STORY_EVENT,
+                        TimelineEvent.source_id.in_(list(wanted_sources))
+                    ).all()
+                }
+
+            for consequence in consequences:
+                if consequence.source_event_id:
+                    source = sources.get(consequence.source_event_id)
+
+                    if source and source.chapter_number > consequence.chapter_number:
+                        # Consequence occurs before its cause
+                        if consequence.id not in flagged_event_ids:
+                            flagged_event_ids.update((consequence.id, source.id))
+                            new_conflicts.append({
+                                "project_id": project_id,
+                                "conflict_type": ConflictType.CONTINUITY_ERROR,
+                                "severity": ConflictSeverity.CRITICAL,
+                                "chapter_start": consequence.chapter_number,
+                                "chapter_end": source.chapter_number,
+                                "event_ids": [consequence.id, source.id],
+                                "title": f"Consequence Before Cause",
+                                "description": f"A consequence occurs in chapter {consequence.chapter_number} "
+                                          f"but its source event is in chapter {source.chapter_number}. "
+                                          f"Effects cannot precede their causes.",
+                                "suggestions": [
+                                    {
+                                        "action": "move_event",
+                                        "event_id": consequence.id,
+                                        "details": f"Move consequence to chapter {source.chapter_number + 1} or later"
+                                    }
+                                ],
+                                "detection_method": "continuity_detector",
+                                "confidence": 1.0,
+                            })
+                            conflicts_created += 1
+
+            if new_conflicts:
+                self.db.execute(insert(TimelineConflict), new_conflicts)
+                new_conflicts = []
 
-        self.db.commit()
         return conflicts_created
 
     # ==================== Conflict Management ====================
@@ -1019,22 +1594,39 @@ class TimelineService:
             query = query.filter(TimelineConflict.status == status)
 
         if chapter_range:
+            # Any overlap with [start, end], including conflicts spanning the
+            # whole range; arc errors store a reversed span (end < start)
             start, end = chapter_range
             query = query.filter(
                 or_(
                     and_(
-                        TimelineConflict.chapter_start >= start,
-                        TimelineConflict.chapter_start <= end
+                        TimelineConflict.chapter_start <= end,
+                        TimelineConflict.chapter_end >= start
                     ),
                     and_(
-                        TimelineConflict.chapter_end >= start,
-                        TimelineConflict.chapter_end <= end
+                        TimelineConflict.chapter_end <= end,
+                        TimelineConflict.chapter_start >= start
                     )
                 )
             )
 
+        # Most severe first via an explicit rank, matching ix_tc_project_severity_rank
+        severity_type = TimelineConflict.severity.type
+        severity_rank = case(
+            *[
+                (literal(severity, severity_type), rank)
+                for rank, severity in enumerate((
+                    ConflictSeverity.CRITICAL,
+                    ConflictSeverity.ERROR,
+                    ConflictSeverity.WARNING,
+                    ConflictSeverity.INFO,
+                ))
+            ],
+            value=TimelineConflict.severity
+        )
+
         return query.order_by(
-            TimelineConflict.severity.desc(),
+            severity_rank,
             TimelineConflict.chapter_start
         ).all()
 
@@ -1045,34 +1637,27 @@ class TimelineService:
         user_id: Optional[int] = None
     ) -> Optional[TimelineConflict]:
         """Mark a conflict as resolved"""
-        conflict = self.db.query(TimelineConflict).filter(
-            TimelineConflict.id == conflict_id
-        ).first()
-
-        if not conflict:
-            return None
-
-        conflict.status = "resolved"
-        conflict.resolution_note = resolution_note
-        conflict.resolved_at = datetime.utcnow()
-        conflict.resolved_by_user_id = user_id
-
-        self.db.commit()
-        self.db.refresh(conflict)
-        return conflict
+        return self._update_conflict(
+            conflict_id,
+            status="resolved",
+            resolution_note=resolution_note,
+            resolved_at=datetime.utcnow(),
+            resolved_by_user_id=user_id
+        )
 
     def ignore_conflict(self, conflict_id: int) -> Optional[TimelineConflict]:
         """Mark a conflict as ignored (user acknowledges but won't fix)"""
-        conflict = self.db.query(TimelineConflict).filter(
-            TimelineConflict.id == conflict_id
-        ).first()
+        return self._update_conflict(conflict_id, status="ignored")
 
-        if not conflict:
-            return None
+    def _update_conflict(self, conflict_id: int, **values) -> Optional[TimelineConflict]:
+        """Apply values to one conflict in a single UPDATE ... RETURNING"""
+        conflict = self.db.execute(
+            update(TimelineConflict).where(
+                TimelineConflict.id == conflict_id
+            ).values(**values).returning(TimelineConflict)
+        ).scalar_one_or_none()
 
-        conflict.status = "ignored"
         self.db.commit()
-        self.db.refresh(conflict)
         return conflict
 
     # ==================== Views & Bookmarks ====================
@@ -2,13 +2,17 @@
 Pytest configuration and fixtures for Agent Collaboration tests
 """
 
+import asyncio
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
 
 from backend.core.database import Base
+from backend.core.database.base import json_serializer, json_deserializer
 from backend.core.models import (
     Project, Agent, AgentTask, AgentConversation, AgentMessage,
     AgentMemory, AgentVote, Character, Chapter,
@@ -16,13 +20,48 @@ from backend.core.models import (
 )
 from backend.main import app
 
+try:
+    import uvloop  # Linux/macOS only; comes with uvicorn[standard]
+except ImportError:
+    uvloop = None
+
+
+# Built once; fixtures reuse them (treat as read-only)
+_CHAPTER_CONTENT = "Once upon a time..." * 100
+_EMBEDDING_1 = [0.1] * 128  # Dummy embeddings
+_EMBEDDING_2 = [0.2] * 128
+_EMBEDDING_3 = [0.3] * 128
+
 
 # ==================== DATABASE FIXTURES ====================
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def db_engine():
-    """Create test database engine"""
-    engine = create_engine("sqlite:///:memory:", echo=False)
+    """
+    Create test database engine
+
+    One in-memory database (StaticPool keeps the single connection alive)
+    with the schema created once for the whole test session. Under
+    pytest-xdist every worker process gets its own private copy.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer
+    )
+
+    # Let SQLAlchemy drive transactions so SAVEPOINTs work with pysqlite
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
     yield engine
     Base.metadata.drop_all(engine)
@@ -30,16 +69,45 @@ def db_engine():
 
 @pytest.fixture(scope="function")
 def db_session(db_engine):
-    """Create test database session"""
-    TestingSessionLocal = sessionmaker(bind=db_engine)
+    """
+    Create test database session
+
+    Runs inside an outer transaction that is rolled back after the test;
+    session.commit() only releases a SAVEPOINT, so tests stay isolated.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    TestingSessionLocal = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
     session = TestingSessionLocal()
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole test session (shared by async_client)"""
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def asgi_client():
+    """
+    Create async HTTP client for the app
+
+    Requests are dispatched in-process over ASGI, so there is no
+    per-request thread/loop bridge; built once per test session.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
 
 @pytest.fixture(scope="function")
-def test_client(db_session):
-    """Create FastAPI test client with database override"""
+def async_client(asgi_client, db_session):
+    """Async API client with the database overridden to the test session"""
     def override_get_db():
         try:
             yield db_session
@@ -49,8 +117,7 @@ def test_client(db_session):
     from backend.core.database import get_db
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as client:
-        yield client
+    yield asgi_client
 
     app.dependency_overrides.clear()
 
@@ -63,8 +130,7 @@ def test_project(db_session):
     project = Project(
         id=1,
         name="Test Novel",
-        description="A test writing project",
-        created_at=datetime.utcnow()
+        description="A test writing project"
     )
     db_session.add(project)
     db_session.commit()
@@ -111,17 +177,31 @@ def test_agents(db_session, test_project):
         ),
     ]
 
-    for agent in agents:
-        db_session.add(agent)
-
+    db_session.add_all(agents)
     db_session.commit()
 
-    for agent in agents:
-        db_session.refresh(agent)
-
     return agents
 
 
+@pytest.fixture(scope="session")
+def readonly_agents():
+    """
+    Unsaved agents of every type, keyed by AgentType
+
+    Built once for the session, for tests that only read prompts or
+    capabilities. Never add these to a database session.
+    """
+    return {
+        agent_type: Agent(
+            project_id=1,
+            name=f"{agent_type.value.title()} Agent",
+            agent_type=agent_type,
+            role=AgentRole.REVIEWER
+        )
+        for agent_type in AgentType
+    }
+
+
 @pytest.fixture
 def test_tasks(db_session, test_project, test_agents):
     """Create test tasks"""
@@ -170,14 +250,9 @@ def test_tasks(db_session, test_project, test_agents):
         ),
     ]
 
-    for task in tasks:
-        db_session.add(task)
-
+    db_session.add_all(tasks)
     db_session.commit()
 
-    for task in tasks:
-        db_session.refresh(task)
-
     return tasks
 
 
@@ -221,14 +296,9 @@ def test_messages(db_session, test_conversation, test_agents):
         ),
     ]
 
-    for message in messages:
-        db_session.add(message)
-
+    db_session.add_all(messages)
     db_session.commit()
 
-    for message in messages:
-        db_session.refresh(message)
-
     return messages
 
 
@@ -242,7 +312,7 @@ def test_memories(db_session, test_project, test_agents):
             memory_type=MemoryType.EPISODIC,
             content="User prefers three-act structure",
             importance=0.8,
-            embedding=[0.1] * 128,  # Dummy embedding
+            embedding=_EMBEDDING_1,
             source_type="task",
             source_id=1
         ),
@@ -252,7 +322,7 @@ def test_memories(db_session, test_project, test_agents):
             memory_type=MemoryType.FEEDBACK,
             content="User wants more foreshadowing",
             importance=0.9,
-            embedding=[0.2] * 128,
+            embedding=_EMBEDDING_2,
             source_type="user_feedback"
         ),
         AgentMemory(
@@ -261,20 +331,15 @@ def test_memories(db_session, test_project, test_agents):
             memory_type=MemoryType.PROCEDURAL,
             content="Character arcs should span 5+ chapters",
             importance=0.7,
-            embedding=[0.3] * 128,
+            embedding=_EMBEDDING_3,
             source_type="task",
             source_id=2
         ),
     ]
 
-    for memory in memories:
-        db_session.add(memory)
-
+    db_session.add_all(memories)
     db_session.commit()
 
-    for memory in memories:
-        db_session.refresh(memory)
-
     return memories
 
 
@@ -302,7 +367,7 @@ def test_chapter(db_session, test_project):
         project_id=test_project.id,
         chapter_number=1,
         title="The Beginning",
-        content="Once upon a time..." * 100  # Some content
+        content=_CHAPTER_CONTENT
     )
 
     db_session.add(chapter)
@@ -328,6 +393,13 @@ def memory_service(db_session):
     return AgentMemoryService(db_session)
 
 
+@pytest.fixture
+def timeline_service(db_session):
+    """Create TimelineService instance"""
+    from backend.services.timeline_service import TimelineService
+    return TimelineService(db_session)
+
+
 # ==================== HELPER FIXTURES ====================
 
 @pytest.fixture
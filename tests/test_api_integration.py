@@ -4,32 +4,61 @@ Integration tests for Agent Collaboration API
 Tests full request-response cycle through FastAPI endpoints.
 """
 
+import orjson
 import pytest
 from datetime import datetime
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+
+from backend.api.schemas.agent_collaboration import (
+    AgentStatisticsResponse, TaskStatisticsResponse,
+    MemoryStatisticsResponse, ProjectAgentStatisticsResponse
+)
+from backend.main import app
+
+
+# Request bodies shared across tests (treat as read-only)
+_AGENT_BODY = {
+    "name": "New Agent",
+    "agent_type": "plotting",
+    "role": "contributor",
+    "description": "Test agent",
+    "model_name": "claude-sonnet-4",
+    "temperature": 0.7,
+    "max_tokens": 4000,
+    "capabilities": ["plot_analysis"]
+}
+
+
+def _json(response):
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
+
+
+def _voting_body(agents):
+    """Two-option voting request proposed by the first two agents"""
+    return {
+        "voting_options": [
+            {"id": 1, "description": "Option A", "proposed_by_agent_id": agents[0].id},
+            {"id": 2, "description": "Option B", "proposed_by_agent_id": agents[1].id}
+        ],
+        "resolution_strategy": "voting"
+    }
 
 
 # ==================== AGENT MANAGEMENT API ====================
 
 @pytest.mark.integration
 @pytest.mark.agent
-def test_create_agent_endpoint(test_client, test_project):
+async def test_create_agent_endpoint(async_client, test_project):
     """Test POST /api/projects/{id}/agents"""
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/agents",
-        json={
-            "name": "New Agent",
-            "agent_type": "plotting",
-            "role": "contributor",
-            "description": "Test agent",
-            "model_name": "claude-sonnet-4",
-            "temperature": 0.7,
-            "max_tokens": 4000,
-            "capabilities": ["plot_analysis"]
-        }
+        json=_AGENT_BODY
     )
 
     assert response.status_code == 201
-    data = response.json()
+    data = _json(response)
     assert data["name"] == "New Agent"
     assert data["agent_type"] == "plotting"
     assert data["is_active"] is True
@@ -37,53 +66,53 @@ def test_create_agent_endpoint(test_client, test_project):
 
 @pytest.mark.integration
 @pytest.mark.agent
-def test_list_agents_endpoint(test_client, test_project, test_agents):
+async def test_list_agents_endpoint(async_client, test_project, test_agents):
     """Test GET /api/projects/{id}/agents"""
-    response = test_client.get(f"/api/projects/{test_project.id}/agents")
+    response = await async_client.get(f"/api/projects/{test_project.id}/agents")
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert isinstance(data, list)
     assert len(data) >= len(test_agents)
 
 
 @pytest.mark.integration
 @pytest.mark.agent
-def test_list_agents_filter_by_type(test_client, test_project, test_agents):
+async def test_list_agents_filter_by_type(async_client, test_project, test_agents):
     """Test GET /api/projects/{id}/agents with type filter"""
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/agents?agent_type=plotting"
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     for agent in data:
         assert agent["agent_type"] == "plotting"
 
 
 @pytest.mark.integration
 @pytest.mark.agent
-def test_get_agent_details_endpoint(test_client, test_project, test_agents):
+async def test_get_agent_details_endpoint(async_client, test_project, test_agents):
     """Test GET /api/projects/{id}/agents/{agent_id}"""
     agent = test_agents[0]
 
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/agents/{agent.id}"
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["id"] == agent.id
     assert data["name"] == agent.name
 
 
 @pytest.mark.integration
 @pytest.mark.agent
-def test_update_agent_endpoint(test_client, test_project, test_agents):
+async def test_update_agent_endpoint(async_client, test_project, test_agents):
     """Test PATCH /api/projects/{id}/agents/{agent_id}"""
     agent = test_agents[0]
 
-    response = test_client.patch(
+    response = await async_client.patch(
         f"/api/projects/{test_project.id}/agents/{agent.id}",
         json={
             "name": "Updated Name",
@@ -92,17 +121,17 @@ def test_update_agent_endpoint(test_client, test_project, test_agents):
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["name"] == "Updated Name"
     assert data["is_active"] is False
 
 
 @pytest.mark.integration
 @pytest.mark.agent
-def test_delete_agent_endpoint(test_client, test_project):
+async def test_delete_agent_endpoint(async_client, test_project):
     """Test DELETE /api/projects/{id}/agents/{agent_id}"""
     # Create agent to delete
-    create_response = test_client.post(
+    create_response = await async_client.post(
         f"/api/projects/{test_project.id}/agents",
         json={
             "name": "To Delete",
@@ -110,60 +139,57 @@ def test_delete_agent_endpoint(test_client, test_project):
             "role": "contributor"
         }
     )
-    agent_id = create_response.json()["id"]
+    agent_url = f"/api/projects/{test_project.id}/agents/{_json(create_response)['id']}"
 
     # Delete agent
-    delete_response = test_client.delete(
-        f"/api/projects/{test_project.id}/agents/{agent_id}"
-    )
+    delete_response = await async_client.delete(agent_url)
 
     assert delete_response.status_code == 204
 
     # Verify deleted
-    get_response = test_client.get(
-        f"/api/projects/{test_project.id}/agents/{agent_id}"
-    )
+    get_response = await async_client.get(agent_url)
     assert get_response.status_code == 404
 
 
 @pytest.mark.integration
 @pytest.mark.agent
-def test_initialize_default_agents_endpoint(test_client, test_project):
+async def test_initialize_default_agents_endpoint(async_client, test_project):
     """Test POST /api/projects/{id}/agents/initialize"""
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/agents/initialize"
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert isinstance(data, list)
-    assert len(data) == 5  # Should create 5 default agents
+    # Should create the 5 default agents, in order
+    assert [agent["agent_type"] for agent in data] == [
+        "plotting", "character", "dialogue", "continuity", "qc"
+    ]
 
 
 @pytest.mark.integration
 @pytest.mark.agent
-def test_get_agent_statistics_endpoint(test_client, test_project, test_agents):
+async def test_get_agent_statistics_endpoint(async_client, test_project, test_agents):
     """Test GET /api/projects/{id}/agents/{agent_id}/statistics"""
     agent = test_agents[0]
 
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/agents/{agent.id}/statistics"
     )
 
     assert response.status_code == 200
-    data = response.json()
-    assert "agent_name" in data
-    assert "tasks_completed" in data
-    assert "success_rate" in data
+    # Raises if any field is missing or mistyped
+    AgentStatisticsResponse.model_validate(_json(response))
 
 
 # ==================== TASK MANAGEMENT API ====================
 
 @pytest.mark.integration
 @pytest.mark.task
-def test_create_task_endpoint(test_client, test_project):
+async def test_create_task_endpoint(async_client, test_project):
     """Test POST /api/projects/{id}/tasks"""
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/tasks",
         json={
             "title": "New Task",
@@ -177,7 +203,7 @@ def test_create_task_endpoint(test_client, test_project):
     )
 
     assert response.status_code == 201
-    data = response.json()
+    data = _json(response)
     assert data["title"] == "New Task"
     assert data["priority"] == "high"
     assert data["status"] == "pending"
@@ -185,9 +211,9 @@ def test_create_task_endpoint(test_client, test_project):
 
 @pytest.mark.integration
 @pytest.mark.task
-def test_create_batch_tasks_endpoint(test_client, test_project):
+async def test_create_batch_tasks_endpoint(async_client, test_project):
     """Test POST /api/projects/{id}/tasks/batch"""
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/tasks/batch",
         json={
             "tasks": [
@@ -206,19 +232,20 @@ def test_create_batch_tasks_endpoint(test_client, test_project):
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["total_created"] == 3
     assert len(data["tasks"]) == 3
 
 
 @pytest.mark.integration
 @pytest.mark.task
-def test_get_task_queue_endpoint(test_client, test_project, test_tasks):
+async def test_get_task_queue_endpoint(async_client, test_project, test_tasks):
     """Test GET /api/projects/{id}/tasks"""
-    response = test_client.get(f"/api/projects/{test_project.id}/tasks")
+    response = await async_client.get(f"/api/projects/{test_project.id}/tasks")
 
     assert response.status_code == 200
-    data = response.json()
+    assert response.headers["content-type"].startswith("application/json")
+    data = _json(response)
     assert "tasks" in data
     assert "total" in data
     assert "pending_count" in data
@@ -226,27 +253,27 @@ def test_get_task_queue_endpoint(test_client, test_project, test_tasks):
 
 @pytest.mark.integration
 @pytest.mark.task
-def test_get_task_details_endpoint(test_client, test_project, test_tasks):
+async def test_get_task_details_endpoint(async_client, test_project, test_tasks):
     """Test GET /api/projects/{id}/tasks/{task_id}"""
     task = test_tasks[0]
 
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/tasks/{task.id}"
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["id"] == task.id
     assert data["title"] == task.title
 
 
 @pytest.mark.integration
 @pytest.mark.task
-def test_update_task_endpoint(test_client, test_project, test_tasks):
+async def test_update_task_endpoint(async_client, test_project, test_tasks):
     """Test PATCH /api/projects/{id}/tasks/{task_id}"""
     task = test_tasks[2]  # Pending task
 
-    response = test_client.patch(
+    response = await async_client.patch(
         f"/api/projects/{test_project.id}/tasks/{task.id}",
         json={
             "title": "Updated Title",
@@ -255,52 +282,52 @@ def test_update_task_endpoint(test_client, test_project, test_tasks):
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["title"] == "Updated Title"
     assert data["priority"] == "critical"
 
 
 @pytest.mark.integration
 @pytest.mark.task
-def test_assign_task_endpoint(test_client, test_project, test_tasks, test_agents):
+async def test_assign_task_endpoint(async_client, test_project, test_tasks, test_agents):
     """Test POST /api/projects/{id}/tasks/{task_id}/assign"""
     task = test_tasks[2]  # Pending task
     agent = test_agents[0]
 
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/tasks/{task.id}/assign",
         json={"agent_id": agent.id}
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["agent_id"] == agent.id
     assert data["status"] == "assigned"
 
 
 @pytest.mark.integration
 @pytest.mark.task
-def test_start_task_endpoint(test_client, test_project, test_tasks):
+async def test_start_task_endpoint(async_client, test_project, test_tasks):
     """Test POST /api/projects/{id}/tasks/{task_id}/start"""
     task = test_tasks[0]  # Assigned task
 
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/tasks/{task.id}/start"
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["status"] == "in_progress"
     assert data["started_at"] is not None
 
 
 @pytest.mark.integration
 @pytest.mark.task
-def test_complete_task_endpoint(test_client, test_project, test_tasks):
+async def test_complete_task_endpoint(async_client, test_project, test_tasks):
     """Test POST /api/projects/{id}/tasks/{task_id}/complete"""
     task = test_tasks[1]  # In-progress task
 
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/tasks/{task.id}/complete",
         json={
             "result": {"analysis": "Complete"},
@@ -309,33 +336,30 @@ def test_complete_task_endpoint(test_client, test_project, test_tasks):
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["status"] == "completed"
     assert data["user_rating"] == 4.5
 
 
 @pytest.mark.integration
 @pytest.mark.task
-def test_get_task_statistics_endpoint(test_client, test_project, test_tasks):
+async def test_get_task_statistics_endpoint(async_client, test_project, test_tasks):
     """Test GET /api/projects/{id}/tasks/statistics"""
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/tasks/statistics"
     )
 
     assert response.status_code == 200
-    data = response.json()
-    assert "total_tasks" in data
-    assert "status_counts" in data
-    assert "priority_counts" in data
+    TaskStatisticsResponse.model_validate(_json(response))
 
 
 # ==================== CONVERSATION API ====================
 
 @pytest.mark.integration
 @pytest.mark.conversation
-def test_create_conversation_endpoint(test_client, test_project, test_agents):
+async def test_create_conversation_endpoint(async_client, test_project, test_agents):
     """Test POST /api/projects/{id}/conversations"""
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/conversations",
         json={
             "title": "Test Discussion",
@@ -346,35 +370,35 @@ def test_create_conversation_endpoint(test_client, test_project, test_agents):
     )
 
     assert response.status_code == 201
-    data = response.json()
+    data = _json(response)
     assert data["title"] == "Test Discussion"
     assert len(data["participant_agent_ids"]) == 2
 
 
 @pytest.mark.integration
 @pytest.mark.conversation
-def test_list_conversations_endpoint(test_client, test_project, test_conversation):
+async def test_list_conversations_endpoint(async_client, test_project, test_conversation):
     """Test GET /api/projects/{id}/conversations"""
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/conversations"
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert isinstance(data, list)
     assert len(data) >= 1
 
 
 @pytest.mark.integration
 @pytest.mark.conversation
-def test_get_conversation_details_endpoint(test_client, test_project, test_conversation, test_messages):
+async def test_get_conversation_details_endpoint(async_client, test_project, test_conversation, test_messages):
     """Test GET /api/projects/{id}/conversations/{id}"""
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/conversations/{test_conversation.id}"
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["id"] == test_conversation.id
     assert "messages" in data
     assert len(data["messages"]) >= len(test_messages)
@@ -382,9 +406,9 @@ def test_get_conversation_details_endpoint(test_client, test_project, test_conve
 
 @pytest.mark.integration
 @pytest.mark.conversation
-def test_add_message_endpoint(test_client, test_project, test_conversation, test_agents):
+async def test_add_message_endpoint(async_client, test_project, test_conversation, test_agents):
     """Test POST /api/projects/{id}/conversations/{id}/messages"""
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/conversations/{test_conversation.id}/messages",
         json={
             "agent_id": test_agents[0].id,
@@ -395,51 +419,38 @@ def test_add_message_endpoint(test_client, test_project, test_conversation, test
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["content"] == "New message"
     assert data["agent_id"] == test_agents[0].id
 
 
 @pytest.mark.integration
 @pytest.mark.conversation
-def test_initiate_voting_endpoint(test_client, test_project, test_conversation, test_agents):
+async def test_initiate_voting_endpoint(async_client, test_project, test_conversation, test_agents):
     """Test POST /api/projects/{id}/conversations/{id}/vote"""
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/conversations/{test_conversation.id}/vote",
-        json={
-            "voting_options": [
-                {"id": 1, "description": "Option A", "proposed_by_agent_id": test_agents[0].id},
-                {"id": 2, "description": "Option B", "proposed_by_agent_id": test_agents[1].id}
-            ],
-            "resolution_strategy": "voting"
-        }
+        json=_voting_body(test_agents)
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["has_conflict"] is True
     assert data["voting_options"] is not None
 
 
 @pytest.mark.integration
 @pytest.mark.conversation
-def test_cast_vote_endpoint(test_client, test_project, test_conversation, test_agents):
+async def test_cast_vote_endpoint(async_client, test_project, test_conversation, test_agents):
     """Test POST /api/projects/{id}/conversations/{id}/cast-vote"""
+    conversation_url = f"/api/projects/{test_project.id}/conversations/{test_conversation.id}"
+
     # First initiate voting
-    test_client.post(
-        f"/api/projects/{test_project.id}/conversations/{test_conversation.id}/vote",
-        json={
-            "voting_options": [
-                {"id": 1, "description": "Option A", "proposed_by_agent_id": test_agents[0].id},
-                {"id": 2, "description": "Option B", "proposed_by_agent_id": test_agents[1].id}
-            ],
-            "resolution_strategy": "voting"
-        }
-    )
+    await async_client.post(f"{conversation_url}/vote", json=_voting_body(test_agents))
 
     # Cast vote
-    response = test_client.post(
-        f"/api/projects/{test_project.id}/conversations/{test_conversation.id}/cast-vote",
+    response = await async_client.post(
+        f"{conversation_url}/cast-vote",
         json={
             "agent_id": test_agents[0].id,
             "option_id": 1,
@@ -448,7 +459,7 @@ def test_cast_vote_endpoint(test_client, test_project, test_conversation, test_a
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["agent_id"] == test_agents[0].id
     assert data["option_id"] == 1
 
@@ -457,9 +468,9 @@ def test_cast_vote_endpoint(test_client, test_project, test_conversation, test_a
 
 @pytest.mark.integration
 @pytest.mark.memory
-def test_create_memory_endpoint(test_client, test_project, test_agents):
+async def test_create_memory_endpoint(async_client, test_project, test_agents):
     """Test POST /api/projects/{id}/agents/{id}/memories"""
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/agents/{test_agents[0].id}/memories",
         json={
             "content": "New memory",
@@ -470,7 +481,7 @@ def test_create_memory_endpoint(test_client, test_project, test_agents):
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["content"] == "New memory"
     assert data["memory_type"] == "episodic"
     assert data["importance"] == 0.7
@@ -478,37 +489,37 @@ def test_create_memory_endpoint(test_client, test_project, test_agents):
 
 @pytest.mark.integration
 @pytest.mark.memory
-def test_list_memories_endpoint(test_client, test_project, test_agents, test_memories):
+async def test_list_memories_endpoint(async_client, test_project, test_agents, test_memories):
     """Test GET /api/projects/{id}/agents/{id}/memories"""
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/agents/{test_agents[0].id}/memories"
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert isinstance(data, list)
     assert len(data) >= 2  # Agent 0 has 2+ memories
 
 
 @pytest.mark.integration
 @pytest.mark.memory
-def test_list_memories_filter_by_type(test_client, test_project, test_agents, test_memories):
+async def test_list_memories_filter_by_type(async_client, test_project, test_agents, test_memories):
     """Test GET /api/projects/{id}/agents/{id}/memories with type filter"""
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/agents/{test_agents[0].id}/memories?memory_type=feedback"
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     for memory in data:
         assert memory["memory_type"] == "feedback"
 
 
 @pytest.mark.integration
 @pytest.mark.memory
-def test_search_memories_endpoint(test_client, test_project, test_agents, test_memories):
+async def test_search_memories_endpoint(async_client, test_project, test_agents, test_memories):
     """Test POST /api/projects/{id}/agents/{id}/memories/search"""
-    response = test_client.post(
+    response = await async_client.post(
         f"/api/projects/{test_project.id}/agents/{test_agents[0].id}/memories/search",
         json={
             "query": "three-act structure",
@@ -517,7 +528,7 @@ def test_search_memories_endpoint(test_client, test_project, test_agents, test_m
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert "results" in data
     assert "total" in data
     # Results should have memory and similarity_score
@@ -528,32 +539,40 @@ def test_search_memories_endpoint(test_client, test_project, test_agents, test_m
 
 @pytest.mark.integration
 @pytest.mark.memory
-def test_get_memory_statistics_endpoint(test_client, test_project, test_agents, test_memories):
+async def test_get_memory_statistics_endpoint(async_client, test_project, test_agents, test_memories):
     """Test GET /api/projects/{id}/agents/{id}/memories/statistics"""
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/agents/{test_agents[0].id}/memories/statistics"
     )
 
     assert response.status_code == 200
-    data = response.json()
-    assert "total_memories" in data
-    assert "type_counts" in data
-    assert "average_importance" in data
+    MemoryStatisticsResponse.model_validate(_json(response))
 
 
 # ==================== PROJECT STATISTICS API ====================
 
 @pytest.mark.integration
-def test_get_project_statistics_endpoint(test_client, test_project, test_agents, test_tasks):
+async def test_get_project_statistics_endpoint(async_client, test_project, test_agents, test_tasks):
     """Test GET /api/projects/{id}/agent-collaboration/statistics"""
-    response = test_client.get(
+    response = await async_client.get(
         f"/api/projects/{test_project.id}/agent-collaboration/statistics"
     )
 
     assert response.status_code == 200
-    data = response.json()
-    assert "total_agents" in data
-    assert "active_agents" in data
-    assert "total_tasks" in data
-    assert "agents_by_type" in data
-    assert data["total_agents"] >= len(test_agents)
+    stats = ProjectAgentStatisticsResponse.model_validate(_json(response))
+    assert stats.total_agents >= len(test_agents)
+
+
+# ==================== RESPONSE CLASS ====================
+
+@pytest.mark.integration
+def test_project_routes_use_orjson():
+    """Every /api/projects route renders through ORJSONResponse"""
+    project_routes = [
+        route for route in app.routes
+        if isinstance(route, APIRoute) and route.path.startswith("/api/projects")
+    ]
+
+    assert project_routes
+    for route in project_routes:
+        assert route.response_class is ORJSONResponse, route.path
@@ -7,7 +7,7 @@ Tests memory storage, retrieval, search, and learning logic.
 import pytest
 from datetime import datetime, timedelta
 
-from backend.core.models import AgentMemory, MemoryType, TaskStatus
+from backend.core.models import AgentMemory, AgentTask, MemoryType, TaskStatus
 
 
 # ==================== MEMORY CREATION ====================
@@ -91,8 +91,6 @@ def test_create_memory_from_task(memory_service, test_agents, test_tasks):
 @pytest.mark.memory
 def test_create_memory_from_high_rated_task_is_procedural(memory_service, test_agents, test_project, db_session):
     """Test that highly rated tasks become procedural memories"""
-    from backend.core.models import AgentTask
-
     task = AgentTask(
         project_id=test_project.id,
         agent_id=test_agents[0].id,
@@ -179,7 +177,7 @@ def test_get_memories_updates_access_count(memory_service, test_agents, test_mem
 
     memory_service.get_memories(test_agents[0].id, limit=10)
 
-    db_session.refresh(memory)
+    db_session.refresh(memory, ["access_count", "last_accessed_at"])
     assert memory.access_count == initial_count + 1
     assert memory.last_accessed_at is not None
 
@@ -283,7 +281,7 @@ def test_update_memory_importance(memory_service, test_memories, db_session):
     updated = memory_service.update_memory_importance(memory.id, new_importance)
 
     assert updated.importance == new_importance
-    db_session.refresh(memory)
+    db_session.refresh(memory, ["importance"])
     assert memory.importance == new_importance
 
 
@@ -319,14 +317,14 @@ def test_decay_memories(memory_service, test_project, test_agents, db_session):
     )
     db_session.add(old_memory)
     db_session.commit()
-    db_session.refresh(old_memory)
+    db_session.refresh(old_memory, ["importance"])
 
     initial_importance = old_memory.importance
 
     # Apply decay
     memory_service.decay_memories(test_agents[0].id)
 
-    db_session.refresh(old_memory)
+    db_session.refresh(old_memory, ["importance"])
     # Importance should decrease
     assert old_memory.importance < initial_importance
 
@@ -500,6 +498,24 @@ def test_generate_embedding_deterministic(memory_service):
     assert emb1 == emb2
 
 
+@pytest.mark.unit
+@pytest.mark.memory
+def test_embedding_round_trips_as_float32(memory_service, db_session, test_project, test_agents):
+    """Test embeddings are stored as float32 bytes and read back as float lists"""
+    memory = memory_service.create_memory(
+        agent_id=test_agents[0].id,
+        project_id=test_project.id,
+        content="Stored vector",
+        memory_type=MemoryType.SEMANTIC
+    )
+    expected = memory_service._generate_embedding("Stored vector")
+
+    db_session.expire(memory)
+
+    assert isinstance(memory.embedding, list)
+    assert memory.embedding == pytest.approx(expected, abs=1e-7)
+
+
 @pytest.mark.unit
 @pytest.mark.memory
 def test_cosine_similarity(memory_service):
@@ -133,7 +133,6 @@ def test_find_best_agent_for_plot_task(orchestration_service, test_project, test
     )
     db_session.add(task)
     db_session.commit()
-    db_session.refresh(task)
 
     best_agent = orchestration_service._find_best_agent_for_task(task)
 
@@ -181,7 +180,7 @@ def test_start_task(orchestration_service, test_tasks, test_agents, db_session):
     assert started_task.started_at is not None
 
     # Check agent is marked as busy
-    db_session.refresh(agent)
+    db_session.refresh(agent, ["is_busy", "current_task_id"])
     assert agent.is_busy is True
     assert agent.current_task_id == task.id
 
@@ -206,7 +205,7 @@ def test_complete_task(orchestration_service, test_tasks, test_agents, db_sessio
     assert completed_task.user_rating == 4.5
 
     # Check agent stats updated
-    db_session.refresh(agent)
+    db_session.refresh(agent, ["is_busy", "current_task_id", "tasks_completed"])
     assert agent.is_busy is False
     assert agent.current_task_id is None
     assert agent.tasks_completed == 9  # Was 8, now 9
@@ -235,7 +234,7 @@ def test_complete_task_updates_satisfaction_score(orchestration_service, test_ag
         user_rating=5.0
     )
 
-    db_session.refresh(agent)
+    db_session.refresh(agent, ["user_satisfaction_score"])
     # Score should increase (running average)
     assert agent.user_satisfaction_score > initial_score
 
@@ -258,7 +257,7 @@ def test_fail_task_with_retry(orchestration_service, test_tasks, test_agents, db
     assert failed_task.status == TaskStatus.PENDING  # Retrying
 
     # Check agent stats
-    db_session.refresh(agent)
+    db_session.refresh(agent, ["is_busy", "tasks_failed"])
     assert agent.is_busy is False
     assert agent.tasks_failed == 1  # Was 0, now 1
 
@@ -280,11 +279,11 @@ def test_fail_task_max_retries_reached(orchestration_service, test_project, db_s
 
     # Fail 2 more times to reach max
     orchestration_service.fail_task(task.id, "Error 1", auto_retry=True)
-    db_session.refresh(task)
+    db_session.refresh(task, ["status"])
     assert task.status == TaskStatus.PENDING  # Still retrying (3/3)
 
     orchestration_service.fail_task(task.id, "Error 2", auto_retry=True)
-    db_session.refresh(task)
+    db_session.refresh(task, ["status"])
     assert task.status == TaskStatus.FAILED  # Max reached
 
 
@@ -302,8 +301,7 @@ def test_check_dependencies_complete(orchestration_service, test_project, db_ses
         status=TaskStatus.COMPLETED
     )
     db_session.add(task1)
-    db_session.commit()
-    db_session.refresh(task1)
+    db_session.flush()  # Assigns task1.id for the dependency below
 
     # Create dependent task
     task2 = AgentTask(
@@ -315,7 +313,6 @@ def test_check_dependencies_complete(orchestration_service, test_project, db_ses
     )
     db_session.add(task2)
     db_session.commit()
-    db_session.refresh(task2)
 
     # Check dependencies
     assert orchestration_service._check_dependencies_complete(task2) is True
@@ -332,8 +329,7 @@ def test_check_dependencies_incomplete(orchestration_service, test_project, db_s
         status=TaskStatus.PENDING
     )
     db_session.add(task1)
-    db_session.commit()
-    db_session.refresh(task1)
+    db_session.flush()  # Assigns task1.id for the dependency below
 
     task2 = AgentTask(
         project_id=test_project.id,
@@ -361,8 +357,7 @@ def test_unblock_dependent_tasks(orchestration_service, test_project, test_agent
         agent_id=test_agents[0].id
     )
     db_session.add(task1)
-    db_session.commit()
-    db_session.refresh(task1)
+    db_session.flush()  # Assigns task1.id for the dependency below
 
     # Create blocked task
     task2 = AgentTask(
@@ -374,13 +369,12 @@ def test_unblock_dependent_tasks(orchestration_service, test_project, test_agent
     )
     db_session.add(task2)
     db_session.commit()
-    db_session.refresh(task2)
 
     # Complete blocker task
     orchestration_service.complete_task(task1.id)
 
     # Check that task2 is unblocked
-    db_session.refresh(task2)
+    db_session.refresh(task2, ["status"])
     assert task2.status == TaskStatus.PENDING
 
 
@@ -432,15 +426,16 @@ def test_get_task_queue_by_status(orchestration_service, test_project):
 def test_get_task_queue_priority_sorting(orchestration_service, test_project, db_session):
     """Test that queue is sorted by priority"""
     # Create tasks with different priorities
-    for priority in [TaskPriority.LOW, TaskPriority.CRITICAL, TaskPriority.MEDIUM]:
-        task = AgentTask(
+    db_session.add_all([
+        AgentTask(
             project_id=test_project.id,
             title=f"Task {priority.value}",
             description="Test",
             priority=priority,
             status=TaskStatus.PENDING
         )
-        db_session.add(task)
+        for priority in [TaskPriority.LOW, TaskPriority.CRITICAL, TaskPriority.MEDIUM]
+    ])
     db_session.commit()
 
     queue = orchestration_service.get_task_queue(test_project.id)
@@ -449,6 +444,27 @@ def test_get_task_queue_priority_sorting(orchestration_service, test_project, db
     assert queue[0].priority == TaskPriority.CRITICAL
 
 
+@pytest.mark.unit
+@pytest.mark.task
+def test_get_task_queue_limit_keeps_most_urgent(orchestration_service, test_project, db_session):
+    """Test that the limit applies after priority sorting"""
+    db_session.add_all([
+        AgentTask(
+            project_id=test_project.id,
+            title=f"Task {priority.value}",
+            description="Test",
+            priority=priority,
+            status=TaskStatus.PENDING
+        )
+        for priority in [TaskPriority.LOW, TaskPriority.LOW, TaskPriority.CRITICAL]
+    ])
+    db_session.commit()
+
+    queue = orchestration_service.get_task_queue(test_project.id, limit=1)
+
+    assert [task.priority for task in queue] == [TaskPriority.CRITICAL]
+
+
 @pytest.mark.unit
 @pytest.mark.task
 def test_get_next_task(orchestration_service, test_agents):
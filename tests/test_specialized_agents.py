@@ -10,7 +10,9 @@ from backend.services.specialized_agents import (
     AgentFactory, PlottingAgent, CharacterAgent, DialogueAgent,
     ContinuityAgent, QCAgent
 )
-from backend.core.models import AgentType, StoryEvent, Consequence, CharacterArc
+from backend.core.models import (
+    Agent, AgentTask, AgentType, StoryEvent, Consequence, CharacterArc
+)
 
 
 # ==================== AGENT FACTORY ====================
@@ -53,8 +55,6 @@ def test_agent_factory_creates_dialogue_agent(db_session, test_agents):
 @pytest.mark.agent
 def test_agent_factory_invalid_type_raises_error(db_session, test_project):
     """Test that unknown agent type raises error"""
-    from backend.core.models import Agent
-
     invalid_agent = Agent(
         project_id=test_project.id,
         name="Invalid",
@@ -70,9 +70,9 @@ def test_agent_factory_invalid_type_raises_error(db_session, test_project):
 
 @pytest.mark.unit
 @pytest.mark.agent
-def test_plotting_agent_system_prompt(db_session, test_agents):
+def test_plotting_agent_system_prompt(db_session, readonly_agents):
     """Test PlottingAgent has appropriate system prompt"""
-    agent = PlottingAgent(test_agents[0], db_session)
+    agent = PlottingAgent(readonly_agents[AgentType.PLOTTING], db_session)
 
     prompt = agent.get_system_prompt()
 
@@ -83,9 +83,9 @@ def test_plotting_agent_system_prompt(db_session, test_agents):
 
 @pytest.mark.unit
 @pytest.mark.agent
-def test_plotting_agent_capabilities(db_session, test_agents):
+def test_plotting_agent_capabilities(db_session, readonly_agents):
     """Test PlottingAgent capabilities"""
-    agent = PlottingAgent(test_agents[0], db_session)
+    agent = PlottingAgent(readonly_agents[AgentType.PLOTTING], db_session)
 
     capabilities = agent.get_capabilities()
 
@@ -98,8 +98,6 @@ def test_plotting_agent_capabilities(db_session, test_agents):
 @pytest.mark.agent
 def test_plotting_agent_analyze_plot(db_session, test_agents, test_project):
     """Test PlottingAgent can analyze plot"""
-    from backend.core.models import AgentTask
-
     agent = PlottingAgent(test_agents[0], db_session)
 
     task = AgentTask(
@@ -122,7 +120,6 @@ def test_plotting_agent_check_pacing(db_session, test_agents, test_project, test
     """Test PlottingAgent pacing analysis"""
     agent = PlottingAgent(test_agents[0], db_session)
 
-    from backend.core.models import AgentTask
     task = AgentTask(
         project_id=test_project.id,
         title="Check pacing",
@@ -140,9 +137,9 @@ def test_plotting_agent_check_pacing(db_session, test_agents, test_project, test
 
 @pytest.mark.unit
 @pytest.mark.agent
-def test_character_agent_system_prompt(db_session, test_agents):
+def test_character_agent_system_prompt(db_session, readonly_agents):
     """Test CharacterAgent system prompt"""
-    agent = CharacterAgent(test_agents[1], db_session)
+    agent = CharacterAgent(readonly_agents[AgentType.CHARACTER], db_session)
 
     prompt = agent.get_system_prompt()
 
@@ -153,9 +150,9 @@ def test_character_agent_system_prompt(db_session, test_agents):
 
 @pytest.mark.unit
 @pytest.mark.agent
-def test_character_agent_capabilities(db_session, test_agents):
+def test_character_agent_capabilities(db_session, readonly_agents):
     """Test CharacterAgent capabilities"""
-    agent = CharacterAgent(test_agents[1], db_session)
+    agent = CharacterAgent(readonly_agents[AgentType.CHARACTER], db_session)
 
     capabilities = agent.get_capabilities()
 
@@ -168,8 +165,6 @@ def test_character_agent_capabilities(db_session, test_agents):
 @pytest.mark.agent
 def test_character_agent_analyze_character(db_session, test_agents, test_project, test_character):
     """Test CharacterAgent analysis"""
-    from backend.core.models import AgentTask
-
     agent = CharacterAgent(test_agents[1], db_session)
 
     task = AgentTask(
@@ -191,8 +186,6 @@ def test_character_agent_analyze_character(db_session, test_agents, test_project
 @pytest.mark.agent
 def test_character_agent_consistency_check(db_session, test_agents, test_project, test_character):
     """Test CharacterAgent consistency checking"""
-    from backend.core.models import AgentTask
-
     agent = CharacterAgent(test_agents[1], db_session)
 
     task = AgentTask(
@@ -213,9 +206,9 @@ def test_character_agent_consistency_check(db_session, test_agents, test_project
 
 @pytest.mark.unit
 @pytest.mark.agent
-def test_dialogue_agent_system_prompt(db_session, test_agents):
+def test_dialogue_agent_system_prompt(db_session, readonly_agents):
     """Test DialogueAgent system prompt"""
-    agent = DialogueAgent(test_agents[2], db_session)
+    agent = DialogueAgent(readonly_agents[AgentType.DIALOGUE], db_session)
 
     prompt = agent.get_system_prompt()
 
@@ -225,9 +218,9 @@ def test_dialogue_agent_system_prompt(db_session, test_agents):
 
 @pytest.mark.unit
 @pytest.mark.agent
-def test_dialogue_agent_capabilities(db_session, test_agents):
+def test_dialogue_agent_capabilities(db_session, readonly_agents):
     """Test DialogueAgent capabilities"""
-    agent = DialogueAgent(test_agents[2], db_session)
+    agent = DialogueAgent(readonly_agents[AgentType.DIALOGUE], db_session)
 
     capabilities = agent.get_capabilities()
 
@@ -240,8 +233,6 @@ def test_dialogue_agent_capabilities(db_session, test_agents):
 @pytest.mark.agent
 def test_dialogue_agent_review_dialogue(db_session, test_agents, test_project, test_chapter):
     """Test DialogueAgent review"""
-    from backend.core.models import AgentTask
-
     agent = DialogueAgent(test_agents[2], db_session)
 
     task = AgentTask(
@@ -262,18 +253,9 @@ def test_dialogue_agent_review_dialogue(db_session, test_agents, test_project, t
 
 @pytest.mark.unit
 @pytest.mark.agent
-def test_continuity_agent_system_prompt(db_session, test_agents):
+def test_continuity_agent_system_prompt(db_session, readonly_agents):
     """Test ContinuityAgent system prompt"""
-    # Create continuity agent
-    from backend.core.models import Agent
-    continuity_agent_model = Agent(
-        project_id=1,
-        name="Continuity Checker",
-        agent_type=AgentType.CONTINUITY,
-        role="reviewer"
-    )
-
-    agent = ContinuityAgent(continuity_agent_model, db_session)
+    agent = ContinuityAgent(readonly_agents[AgentType.CONTINUITY], db_session)
 
     prompt = agent.get_system_prompt()
 
@@ -283,17 +265,9 @@ def test_continuity_agent_system_prompt(db_session, test_agents):
 
 @pytest.mark.unit
 @pytest.mark.agent
-def test_continuity_agent_capabilities(db_session, test_agents):
+def test_continuity_agent_capabilities(db_session, readonly_agents):
     """Test ContinuityAgent capabilities"""
-    from backend.core.models import Agent
-    continuity_agent_model = Agent(
-        project_id=1,
-        name="Test",
-        agent_type=AgentType.CONTINUITY,
-        role="reviewer"
-    )
-
-    agent = ContinuityAgent(continuity_agent_model, db_session)
+    agent = ContinuityAgent(readonly_agents[AgentType.CONTINUITY], db_session)
 
     capabilities = agent.get_capabilities()
 
@@ -306,8 +280,6 @@ def test_continuity_agent_capabilities(db_session, test_agents):
 @pytest.mark.agent
 def test_continuity_agent_check_continuity(db_session, test_project):
     """Test ContinuityAgent continuity check"""
-    from backend.core.models import Agent, AgentTask
-
     continuity_agent_model = Agent(
         project_id=test_project.id,
         name="Test",
@@ -334,18 +306,9 @@ def test_continuity_agent_check_continuity(db_session, test_project):
 
 @pytest.mark.unit
 @pytest.mark.agent
-def test_qc_agent_system_prompt(db_session):
+def test_qc_agent_system_prompt(db_session, readonly_agents):
     """Test QCAgent system prompt"""
-    from backend.core.models import Agent
-
-    qc_agent_model = Agent(
-        project_id=1,
-        name="QC",
-        agent_type=AgentType.QC,
-        role="reviewer"
-    )
-
-    agent = QCAgent(qc_agent_model, db_session)
+    agent = QCAgent(readonly_agents[AgentType.QC], db_session)
 
     prompt = agent.get_system_prompt()
 
@@ -355,18 +318,9 @@ def test_qc_agent_system_prompt(db_session):
 
 @pytest.mark.unit
 @pytest.mark.agent
-def test_qc_agent_capabilities(db_session):
+def test_qc_agent_capabilities(db_session, readonly_agents):
     """Test QCAgent capabilities"""
-    from backend.core.models import Agent
-
-    qc_agent_model = Agent(
-        project_id=1,
-        name="QC",
-        agent_type=AgentType.QC,
-        role="reviewer"
-    )
-
-    agent = QCAgent(qc_agent_model, db_session)
+    agent = QCAgent(readonly_agents[AgentType.QC], db_session)
 
     capabilities = agent.get_capabilities()
 
@@ -379,8 +333,6 @@ def test_qc_agent_capabilities(db_session):
 @pytest.mark.agent
 def test_qc_agent_quality_check(db_session, test_project):
     """Test QCAgent quality check"""
-    from backend.core.models import Agent, AgentTask
-
     qc_agent_model = Agent(
         project_id=test_project.id,
         name="QC",
@@ -408,8 +360,6 @@ def test_qc_agent_quality_check(db_session, test_project):
 @pytest.mark.agent
 def test_qc_agent_calculates_scores(db_session, test_project):
     """Test that QC agent calculates quality scores"""
-    from backend.core.models import Agent, AgentTask
-
     qc_agent_model = Agent(
         project_id=test_project.id,
         name="QC",
@@ -438,8 +388,6 @@ def test_qc_agent_calculates_scores(db_session, test_project):
 @pytest.mark.agent
 def test_base_agent_get_context_with_chapter(db_session, test_agents, test_chapter):
     """Test that base agent includes chapter in context"""
-    from backend.core.models import AgentTask
-
     agent = PlottingAgent(test_agents[0], db_session)
 
     task = AgentTask(
@@ -460,8 +408,6 @@ def test_base_agent_get_context_with_chapter(db_session, test_agents, test_chapt
 @pytest.mark.agent
 def test_base_agent_get_context_with_characters(db_session, test_agents, test_character):
     """Test that base agent includes characters in context"""
-    from backend.core.models import AgentTask
-
     agent = CharacterAgent(test_agents[1], db_session)
 
     task = AgentTask(
@@ -0,0 +1,70 @@
+"""
+Unit tests for TimelineService
+
+Tests timeline sync, conflict detection and resolution.
+"""
+
+import pytest
+from datetime import timedelta
+
+from backend.core.models import (
+    Chapter, TimelineEvent, TimelineConflict, TimelineSyncState,
+    TimelineEventType, TimelineLayer, ConflictType
+)
+
+
+# ==================== TIMELINE SYNC ====================
+
+@pytest.mark.unit
+@pytest.mark.timeline
+def test_sync_picks_up_rows_committed_behind_watermark(timeline_service, test_chapter, db_session):
+    """Test that a row stamped before the watermark but committed later is still synced"""
+    assert timeline_service.sync_project_timeline(test_chapter.project_id)["chapters"] == 1
+    watermark = db_session.query(TimelineSyncState.watermark).filter(
+        TimelineSyncState.project_id == test_chapter.project_id,
+        TimelineSyncState.source_table == "chapters"
+    ).scalar()
+
+    # Flushed by a slow writer before the sync above, committed after it
+    db_session.add(Chapter(
+        project_id=test_chapter.project_id,
+        chapter_number=2,
+        title="The Middle",
+        updated_at=watermark - timedelta(seconds=1)
+    ))
+    db_session.commit()
+
+    assert timeline_service.sync_project_timeline(test_chapter.project_id)["chapters"] == 1
+
+
+# ==================== CONFLICT DETECTION ====================
+
+@pytest.mark.unit
+@pytest.mark.timeline
+def test_resolved_conflict_is_detected_again(timeline_service, test_project, db_session):
+    """Test that resolving a conflict whose cause remains lets a full run flag it again"""
+    db_session.add_all([
+        TimelineEvent(
+            project_id=test_project.id,
+            event_type=TimelineEventType.CUSTOM,
+            chapter_number=1,
+            title=f"Major beat {i}",
+            layer=TimelineLayer.PLOT,
+            is_major_beat=True
+        )
+        for i in range(3)
+    ])
+    db_session.commit()
+
+    assert timeline_service.detect_all_conflicts(test_project.id)["overlap"] == 1
+    conflict = db_session.query(TimelineConflict).filter(
+        TimelineConflict.conflict_type == ConflictType.OVERLAP
+    ).one()
+
+    # Nothing changed since the last full run
+    assert timeline_service.detect_all_conflicts(test_project.id)["overlap"] == 0
+
+    timeline_service.resolve_conflict(conflict.id)
+
+    # The overlap still exists, so it is reported again
+    assert timeline_service.detect_all_conflicts(test_project.id)["overlap"] == 1